@@ -4,97 +4,42 @@ Complete Release Builder for YTDL
 Builds Android APK, Web App, and Desktop versions
 """
 
+import errno
+import hashlib
+import json
 import subprocess
 import sys
 import os
+import threading
+import time
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
-def run_command(cmd, description):
-    """Run a command and handle errors"""
-    print(f"🔧 {description}...")
-    try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
-        print(f"✅ {description} completed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed:")
-        print(f"Error: {e.stderr}")
-        return False
+# Resolved once so Windows gets the full path to flet.exe without a shell
+FLET = shutil.which("flet") or "flet"
 
-def check_requirements():
-    """Check if required tools are installed"""
-    print("🔍 Checking requirements...")
-    
-    # Check if flet is installed
-    try:
-        import flet
-        print("✅ Flet is installed")
-    except ImportError:
-        print("❌ Flet is not installed. Run: uv add 'flet[all]'")
-        return False
-    
-    return True
+# Build tool output is streamed here instead of being held in memory
+LOG_DIR = Path("release") / "logs"
+LOG_TAIL_BYTES = 4096
 
-def clean_build_directory():
-    """Clean previous builds"""
-    print("🧹 Cleaning previous builds...")
-    build_dir = Path("build")
-    if build_dir.exists():
-        shutil.rmtree(build_dir)
-    build_dir.mkdir(exist_ok=True)
-    print("✅ Build directory cleaned")
+# Content hashes of the current build and of the last packaged release
+BUILD_MANIFEST = Path("build") / ".manifest.json"
+RELEASE_MANIFEST = Path("release") / ".last_manifest.json"
 
-def build_desktop():
-    """Build desktop application"""
-    print("🖥️ Building Desktop Application...")
-    
-    platforms = ["windows", "macos", "linux"]
-    success_count = 0
-    
-    for platform in platforms:
-        print(f"📦 Building for {platform}...")
-        build_cmd = f'flet build {platform} --project "YTDL" --verbose'
-        if run_command(build_cmd, f"Building {platform} version"):
-            success_count += 1
-    
-    return success_count > 0
+# Per-file content hashes keyed on size and mtime, kept outside build/ so cleaning keeps it
+HASH_CACHE = Path("release") / ".hash_cache.json"
 
-def build_android():
-    """Build Android APK"""
-    print("📱 Building Android APK...")
-    build_cmd = 'flet build apk --project "YTDL" --org com.grandpaejx.ytdl --verbose'
-    return run_command(build_cmd, "Building Android APK")
+# build/ subtrees flet writes the finished apps to, the rest is flutter bootstrap scaffolding
+RELEASE_TARGETS = ("windows", "macos", "linux", "apk", "web")
 
-def build_web():
-    """Build Web Application"""
-    print("🌐 Building Web Application...")
-    build_cmd = 'flet build web --project "YTDL" --web-renderer canvaskit --verbose'
-    return run_command(build_cmd, "Building Web Application")
+# Userspace copy fallback uses one 256 KiB buffer per thread
+_COPY_BUFSIZE = 1 << 18
+_copy_buffers = threading.local()
 
-def create_release_package():
-    """Create release package with all builds"""
-    print("📦 Creating release package...")
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    release_dir = Path(f"release/ytdl_release_{timestamp}")
-    release_dir.mkdir(parents=True, exist_ok=True)
-    
-    build_dir = Path("build")
-    if not build_dir.exists():
-        print("❌ No build directory found")
-        return False
-    
-    # Copy builds to release directory
-    for item in build_dir.iterdir():
-        if item.is_dir():
-            dest = release_dir / item.name
-            shutil.copytree(item, dest)
-            print(f"✅ Copied {item.name} to release package")
-    
-    # Create release notes
-    release_notes = f"""
+# Static release notes, filled in once per release
+_RELEASE_TEMPLATE = """
 # YTDL Release {timestamp}
 
 ## 🎉 Complete Release Package
@@ -148,11 +93,299 @@ Extract and run the appropriate executable for your platform.
 - Issues: Report bugs and feature requests on GitHub
 
 ---
-Built on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Built on {built_on}
 """
+
+def run_command(cmd: list[str], description: str, log_path=None):
+    """Run a command, streaming its output to a log file"""
+    print(f"🔧 {description}...")
+    if log_path is None:
+        log_path = LOG_DIR / f"{description.lower().replace(' ', '_')}.log"
+    Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(log_path, "w+b") as log_file:
+        try:
+            subprocess.run(cmd, check=True, stdout=log_file, stderr=subprocess.STDOUT)
+            print(f"✅ {description} completed successfully")
+            print(f"📄 Log: {log_path}")
+            return True
+        except subprocess.CalledProcessError:
+            # Only show the tail of the log, the full output stays on disk
+            log_size = log_file.seek(0, os.SEEK_END)
+            log_file.seek(max(0, log_size - LOG_TAIL_BYTES))
+            print(f"❌ {description} failed:")
+            print(f"Error: {log_file.read().decode(errors='replace')}")
+            print(f"📄 Full log: {log_path}")
+            return False
+
+def _copy_file_windows(src, dst):
+    """Copy a file with the native CopyFileW call"""
+    import ctypes
+    if not ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+        raise ctypes.WinError()
+
+def _copy_readinto(src_fd, dst_fd):
+    """Copy the rest of src_fd to dst_fd through a reused per-thread buffer"""
+    buf = getattr(_copy_buffers, "buf", None)
+    if buf is None:
+        buf = _copy_buffers.buf = memoryview(bytearray(_COPY_BUFSIZE))
+    
+    readv = getattr(os, "readv", None)
+    while True:
+        if readv is not None:
+            chunk = buf[:readv(src_fd, [buf])]
+        else:
+            chunk = os.read(src_fd, _COPY_BUFSIZE)
+        if not chunk:
+            break
+        written = 0
+        while written < len(chunk):
+            written += os.write(dst_fd, chunk[written:])
+
+def _copy_file_fd(src, dst, size):
+    """Copy a file in-kernel via copy_file_range, then sendfile, then read/write"""
+    in_fd = os.open(src, os.O_RDONLY)
+    try:
+        out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            copied = 0
+            # Only Linux's sendfile writes to regular files, elsewhere it needs a socket
+            send = getattr(os, "sendfile", None) if sys.platform.startswith("linux") else None
+            for copy in (getattr(os, "copy_file_range", None), send):
+                if copy is None:
+                    continue
+                try:
+                    while copied < size:
+                        if copy is os.sendfile:
+                            sent = os.sendfile(out_fd, in_fd, copied, size - copied)
+                        else:
+                            sent = os.copy_file_range(in_fd, out_fd, size - copied, copied, copied)
+                        if sent == 0:
+                            break
+                        copied += sent
+                    return
+                except OSError as e:
+                    if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.ENOTSUP,
+                                       errno.ENOTSOCK, errno.EBADF):
+                        raise
+            
+            # Plain userspace copy for whatever the kernel paths did not cover
+            os.lseek(in_fd, copied, os.SEEK_SET)
+            os.lseek(out_fd, copied, os.SEEK_SET)
+            _copy_readinto(in_fd, out_fd)
+        finally:
+            os.close(out_fd)
+    finally:
+        os.close(in_fd)
+
+def _copy_file(src, dst, st):
+    """Copy a single file using the fastest available platform primitive"""
+    if sys.platform == "win32":
+        _copy_file_windows(src, dst)
+    else:
+        _copy_file_fd(src, dst, st.st_size)
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.chmod(dst, st.st_mode & 0o7777)
+
+def _fast_copytree(src, dst, link=False):
+    """Recursively copy a directory tree, reusing the stat data from os.scandir
+    
+    With link=True files are hard-linked instead, falling back to a copy
+    where the filesystem does not allow it.
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_symlink():
+                os.symlink(os.readlink(entry.path), target)
+            elif entry.is_dir():
+                _fast_copytree(entry.path, target, link)
+            else:
+                if link:
+                    try:
+                        os.link(entry.path, target)
+                        continue
+                    except OSError:
+                        pass
+                _copy_file(entry.path, target, entry.stat())
+
+def _scan_files(root, prefix=""):
+    """Yield (relative path, absolute path) for every file under root in a stable order"""
+    with os.scandir(root) as entries:
+        entries = sorted(entries, key=lambda entry: entry.name)
+    for entry in entries:
+        rel_path = f"{prefix}/{entry.name}" if prefix else entry.name
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scan_files(entry.path, rel_path)
+        elif entry.is_file(follow_symlinks=False):
+            yield rel_path, entry.path
+
+def _hash_file(path, buf):
+    """Hash the contents of a single file"""
+    digest = hashlib.blake2b()
+    with open(path, "rb") as f:
+        while n := f.readinto(buf):
+            digest.update(buf[:n])
+    return digest.hexdigest()
+
+def _hash_tree(root, cache, new_cache):
+    """Hash the file names and contents of a build subtree
+    
+    Files whose size and mtime match the cache reuse their stored hash
+    instead of being read again.
+    """
+    digest = hashlib.blake2b()
+    buf = memoryview(bytearray(_COPY_BUFSIZE))
+    for rel_path, path in _scan_files(root):
+        st = os.stat(path)
+        cached = cache.get(path)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            file_hash = cached[2]
+        else:
+            file_hash = _hash_file(path, buf)
+        new_cache[path] = [st.st_size, st.st_mtime_ns, file_hash]
+        digest.update(rel_path.encode())
+        digest.update(b"\0")
+        digest.update(file_hash.encode())
+    return digest.hexdigest()
+
+def _release_items(build_dir):
+    """Platform output directories in build/ that go into the release package"""
+    return [build_dir / name for name in RELEASE_TARGETS if (build_dir / name).is_dir()]
+
+def _load_manifest(path):
+    """Load a JSON manifest, returning an empty one if it is missing or unreadable"""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def update_build_manifest():
+    """Record a content hash for every packaged platform subtree in build/"""
+    items = _release_items(Path("build"))
+    cache = _load_manifest(HASH_CACHE)
+    new_cache = {}
+    with ThreadPoolExecutor(max_workers=max(1, len(items))) as executor:
+        hashes = executor.map(lambda item: _hash_tree(str(item), cache, new_cache), items)
+        manifest = dict(zip((item.name for item in items), hashes))
+    BUILD_MANIFEST.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    HASH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    HASH_CACHE.write_text(json.dumps(new_cache), encoding="utf-8")
+    return manifest
+
+def check_requirements():
+    """Check if required tools are installed"""
+    print("🔍 Checking requirements...")
+    
+    # Check if flet is installed
+    try:
+        import flet
+        print("✅ Flet is installed")
+    except ImportError:
+        print("❌ Flet is not installed. Run: uv add 'flet[all]'")
+        return False
+    
+    return True
+
+def _remove_trees(paths):
+    """Delete directory trees, ignoring ones that are already gone"""
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+def clean_build_directory():
+    """Clean previous builds"""
+    print("🧹 Cleaning previous builds...")
+    build_dir = Path("build")
+    # Trees left behind by an interrupted run
+    old_dirs = list(Path().glob(f"{build_dir.name}.old-*"))
+    if build_dir.exists():
+        # Move the old tree aside so the new build can start right away
+        old_dir = build_dir.with_name(f"{build_dir.name}.old-{os.getpid()}-{time.time_ns()}")
+        os.replace(build_dir, old_dir)
+        old_dirs.append(old_dir)
+    if old_dirs:
+        # Deleted in the background, the interpreter waits for this thread before exiting
+        threading.Thread(target=_remove_trees, args=(old_dirs,), name="CleanBuild").start()
+    build_dir.mkdir(exist_ok=True)
+    print("✅ Build directory cleaned")
+
+def build_desktop_platform(platform):
+    """Build desktop application for a single platform"""
+    print(f"📦 Building for {platform}...")
+    build_cmd = [FLET, "build", platform, "--project", "YTDL", "--verbose"]
+    return run_command(build_cmd, f"Building {platform} version")
+
+def build_desktop():
+    """Build desktop application"""
+    print("🖥️ Building Desktop Application...")
     
-    with open(release_dir / "README.md", "w") as f:
-        f.write(release_notes)
+    platforms = ["windows", "macos", "linux"]
+    
+    # Every flet build shares the build/flutter bootstrap project, so builds run one at a time
+    success_count = sum(build_desktop_platform(platform) for platform in platforms)
+    
+    return success_count > 0
+
+def build_android():
+    """Build Android APK"""
+    print("📱 Building Android APK...")
+    build_cmd = [FLET, "build", "apk", "--project", "YTDL", "--org", "com.grandpaejx.ytdl", "--verbose"]
+    return run_command(build_cmd, "Building Android APK")
+
+def build_web():
+    """Build Web Application"""
+    print("🌐 Building Web Application...")
+    build_cmd = [FLET, "build", "web", "--project", "YTDL", "--web-renderer", "canvaskit", "--verbose"]
+    return run_command(build_cmd, "Building Web Application")
+
+def create_release_package():
+    """Create release package with all builds"""
+    print("📦 Creating release package...")
+    
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    release_dir = Path(f"release/ytdl_release_{timestamp}")
+    release_dir.mkdir(parents=True, exist_ok=True)
+    
+    build_dir = Path("build")
+    if not build_dir.exists():
+        print("❌ No build directory found")
+        return False
+    
+    # Platforms whose build output matches the last release are hard-linked
+    # from it instead of being copied again
+    manifest = update_build_manifest()
+    last_release = _load_manifest(RELEASE_MANIFEST)
+    last_dir = Path(last_release["release_dir"]) if last_release.get("release_dir") else None
+    last_hashes = last_release.get("platforms", {})
+    
+    # Copy builds to release directory, one worker per platform subtree
+    def copy_item(item):
+        previous = last_dir / item.name if last_dir else None
+        if previous and previous.is_dir() and last_hashes.get(item.name) == manifest.get(item.name):
+            _fast_copytree(previous, release_dir / item.name, link=True)
+            print(f"✅ Linked unchanged {item.name} from {last_dir.name}")
+        else:
+            _fast_copytree(item, release_dir / item.name)
+            print(f"✅ Copied {item.name} to release package")
+    
+    items = _release_items(build_dir)
+    with ThreadPoolExecutor(max_workers=max(1, len(items))) as executor:
+        list(executor.map(copy_item, items))
+    
+    RELEASE_MANIFEST.write_text(
+        json.dumps({"release_dir": str(release_dir), "platforms": manifest}, indent=2),
+        encoding="utf-8"
+    )
+    
+    # Create release notes
+    release_notes = _RELEASE_TEMPLATE.format(
+        timestamp=timestamp,
+        built_on=now.strftime("%Y-%m-%d %H:%M:%S")
+    )
+    
+    (release_dir / "README.md").write_text(release_notes, encoding="utf-8")
     
     print(f"✅ Release package created: {release_dir}")
     return True
@@ -166,12 +399,12 @@ def main():
     if not check_requirements():
         sys.exit(1)
     
+    # Change to project root, every build path below is relative to it
+    os.chdir(Path(__file__).parent.parent)
+    
     # Clean build directory
     clean_build_directory()
     
-    # Change to project root
-    os.chdir(Path(__file__).parent.parent)
-    
     # Track build results
     results = {
         "desktop": False,
@@ -182,13 +415,9 @@ def main():
     # Build all platforms
     print("\n📦 Building all platforms...")
     
-    # Desktop builds
+    # flet regenerates the shared build/flutter project for each target, so builds can't overlap
     results["desktop"] = build_desktop()
-    
-    # Android build
     results["android"] = build_android()
-    
-    # Web build
     results["web"] = build_web()
     
     # Create release package
@@ -10,19 +10,34 @@ import os
 import shutil
 from pathlib import Path
 
-def run_command(cmd, description):
-    """Run a command and handle errors"""
+# Resolved once so Windows gets the full path to flet.exe without a shell
+FLET = shutil.which("flet") or "flet"
+
+# Build tool output is streamed here instead of being held in memory
+LOG_DIR = Path("release") / "logs"
+LOG_TAIL_BYTES = 4096
+
+def run_command(cmd: list[str], description: str, log_path=None):
+    """Run a command, streaming its output to a log file"""
     print(f"🔧 {description}...")
-    try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
-        print(f"✅ {description} completed successfully")
-        if result.stdout:
-            print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed:")
-        print(f"Error: {e.stderr}")
-        return False
+    if log_path is None:
+        log_path = LOG_DIR / f"{description.lower().replace(' ', '_')}.log"
+    Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(log_path, "w+b") as log_file:
+        try:
+            subprocess.run(cmd, check=True, stdout=log_file, stderr=subprocess.STDOUT)
+            print(f"✅ {description} completed successfully")
+            print(f"📄 Log: {log_path}")
+            return True
+        except subprocess.CalledProcessError:
+            # Only show the tail of the log, the full output stays on disk
+            log_size = log_file.seek(0, os.SEEK_END)
+            log_file.seek(max(0, log_size - LOG_TAIL_BYTES))
+            print(f"❌ {description} failed:")
+            print(f"Error: {log_file.read().decode(errors='replace')}")
+            print(f"📄 Full log: {log_path}")
+            return False
 
 def check_requirements():
     """Check if required tools are installed"""
@@ -46,7 +61,15 @@ def build_web_app():
     os.chdir(Path(__file__).parent.parent)
     
     # Flet build command for web
-    build_cmd = 'flet build web --project "YTDL" --description "All-in-One Video/Audio Downloader" --base-url "/" --web-renderer canvaskit --route-url-strategy hash --verbose'
+    build_cmd = [
+        FLET, "build", "web",
+        "--project", "YTDL",
+        "--description", "All-in-One Video/Audio Downloader",
+        "--base-url", "/",
+        "--web-renderer", "canvaskit",
+        "--route-url-strategy", "hash",
+        "--verbose",
+    ]
     return run_command(build_cmd, "Building Web Application")
 
 def create_deployment_files():
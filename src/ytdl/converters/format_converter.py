@@ -2,15 +2,157 @@
 Format converter module for YTDL application using FFmpeg
 """
 
+import atexit
 import ffmpeg
+import functools
+import logging
 import os
+import queue
+import selectors
 import threading
 import subprocess
-from pathlib import Path
-from typing import Dict, Any, Callable, Optional, List, Tuple
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, Callable, FrozenSet, Iterator, Mapping, Optional, List, Tuple
 from ..utils.config import Config
 from ..utils.logger import get_logger
 
+# Codecs each output container can hold without re-encoding. When every
+# input stream is listed for the target container the file is remuxed with
+# "-c copy", which skips decoding and encoding entirely and is typically
+# 20-100x faster than a libx264 transcode.
+STREAM_COPY_CODECS = {
+    'mp4': {'h264', 'hevc', 'av1', 'mpeg4', 'aac', 'mp3', 'alac', 'opus', 'mov_text'},
+    'mov': {'h264', 'hevc', 'mpeg4', 'prores', 'aac', 'mp3', 'alac', 'pcm_s16le', 'mov_text'},
+    'mkv': {
+        'h264', 'hevc', 'av1', 'vp8', 'vp9', 'mpeg4', 'mpeg2video',
+        'aac', 'mp3', 'opus', 'vorbis', 'flac', 'ac3', 'eac3', 'dts', 'alac', 'pcm_s16le',
+        'subrip', 'ass', 'webvtt'
+    },
+    'webm': {'vp8', 'vp9', 'av1', 'opus', 'vorbis', 'webvtt'},
+    'mp3': {'mp3'},
+    'wav': {'pcm_s16le'},
+    'flac': {'flac'},
+    'm4a': {'aac', 'alac'},
+    'aac': {'aac'},
+    'ogg': {'vorbis', 'opus', 'flac'},
+}
+
+# Quality choices that allow remuxing: the page defaults, where no particular encode
+# was asked for, and lossless, which a stream copy satisfies exactly
+STREAM_COPY_QUALITIES = frozenset({'medium', '192k', 'lossless'})
+
+# Supported input and output formats, shared by every converter
+_SUPPORTED_FORMATS: Mapping[str, FrozenSet[str]] = MappingProxyType({
+    'video_input': frozenset({'mp4', 'avi', 'mkv', 'mov', 'wmv', 'flv', 'webm', '3gp', 'm4v'}),
+    'video_output': frozenset({'mp4', 'avi', 'mkv', 'mov', 'webm', 'ogv'}),
+    'audio_input': frozenset({'mp3', 'wav', 'flac', 'm4a', 'aac', 'ogg', 'wma'}),
+    'audio_output': frozenset({'mp3', 'wav', 'flac', 'm4a', 'aac', 'ogg'})
+})
+
+# Maximum number of ffprobe results kept in memory
+PROBE_CACHE_SIZE = 128
+
+# Seconds between cancellation checks while waiting for FFmpeg progress
+PROGRESS_POLL_INTERVAL = 0.25
+
+# Video quality presets
+_QUALITY_PRESETS = MappingProxyType({
+    'low': {'crf': 28, 'preset': 'fast'},
+    'medium': {'crf': 23, 'preset': 'medium'},
+    'high': {'crf': 18, 'preset': 'slow'},
+    'lossless': {'crf': 0, 'preset': 'veryslow'}
+})
+
+# MP3 bitrates per quality level
+_MP3_BITRATES = MappingProxyType({
+    'low': '128k',
+    'medium': '192k',
+    'high': '320k',
+    'lossless': '320k'
+})
+
+_VIDEO_FORMATS = frozenset({'mp4', 'mkv', 'avi', 'mov', 'webm'})
+
+@functools.lru_cache(maxsize=128)
+def _parse_ratio(ratio: str) -> float:
+    """Parse an FFprobe ratio string such as '30000/1001' into a float"""
+    num, _, den = ratio.partition('/')
+    try:
+        return float(num) / float(den) if den else float(num)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+def _video_options(quality: str) -> Dict[str, Any]:
+    """Build libx264/AAC encoding options for a quality level"""
+    preset = _QUALITY_PRESETS.get(quality, _QUALITY_PRESETS['medium'])
+    return {
+        'vcodec': 'libx264',
+        'crf': preset['crf'],
+        'preset': preset['preset'],
+        'acodec': 'aac',
+        'audio_bitrate': '128k',
+        'threads': os.cpu_count() or 4
+    }
+
+def _freeze_options(options: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """Turn an options dict into a hashable key for _output_args"""
+    return tuple(sorted(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in options.items()
+    ))
+
+@functools.lru_cache(maxsize=32)
+def _output_args(options: Tuple[Tuple[str, Any], ...]) -> Tuple[str, ...]:
+    """Build FFmpeg output arguments the same way ffmpeg-python compiles them"""
+    kwargs = dict(options)
+    args = []
+    
+    for key, flag in (('format', '-f'), ('video_bitrate', '-b:v'), ('audio_bitrate', '-b:a')):
+        if key in kwargs:
+            args += [flag, str(kwargs.pop(key))]
+    
+    for key, value in sorted(kwargs.items()):
+        for item in (value if isinstance(value, tuple) else (value,)):
+            args.append(f'-{key}')
+            if item is not None:
+                args.append(str(item))
+    
+    return tuple(args)
+
+# Per-format option builders, looked up once per conversion
+_FORMAT_BUILDERS: Mapping[str, Callable[[str], Dict[str, Any]]] = MappingProxyType({
+    **{fmt: _video_options for fmt in _VIDEO_FORMATS},
+    'mp3': lambda quality: {
+        'acodec': 'libmp3lame',
+        # The converter page offers explicit bitrates such as '128k'
+        'audio_bitrate': _MP3_BITRATES.get(quality, quality if quality.endswith('k') else '192k')
+    },
+    'wav': lambda quality: {'acodec': 'pcm_s16le'},
+    'flac': lambda quality: {'acodec': 'flac'},
+    'm4a': lambda quality: {'acodec': 'aac'},
+    'ogg': lambda quality: {'acodec': 'libvorbis'},
+})
+
+# Converters still alive, stopped by shutdown_converters() on exit
+_live_converters: "weakref.WeakSet[FormatConverter]" = weakref.WeakSet()
+
+@dataclass
+class ConversionJob:
+    """A single file conversion submitted as part of a batch"""
+    input_path: str
+    output_path: str
+    output_format: str
+    quality: str = 'medium'
+    custom_options: Optional[Dict[str, Any]] = None
+    # Set to stop this job, whether it is still queued or already running
+    cancelled: threading.Event = field(default_factory=threading.Event, repr=False, compare=False)
+    # Stat of the input taken by the caller, saves stat'ing it again
+    input_stat: Optional[os.stat_result] = field(default=None, repr=False, compare=False)
+
 class FormatConverter:
     """Format converter using FFmpeg"""
     
@@ -19,21 +161,45 @@ class FormatConverter:
         self.logger = get_logger()
         self.current_conversion = None
         self.conversion_cancelled = False
-        self.ffmpeg_process = None
         self.conversion_lock = threading.Lock()
+        self._ffmpeg_processes: set = set()
+        self._batch_pool: Optional[ThreadPoolExecutor] = None
+        self._batch_futures: weakref.WeakSet = weakref.WeakSet()
+        # Cancel flags of submitted jobs, set together by cancel_conversion()
+        self._cancel_events: weakref.WeakSet = weakref.WeakSet()
+        # Shared by the pool's worker threads, so only touched under _probe_lock
+        self._probe_cache: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+        self._probe_lock = threading.Lock()
+        # Output arguments for plain conversions, keyed on everything that shapes them
+        self._plain_output_args = functools.lru_cache(maxsize=64)(self._build_output_args)
+        _live_converters.add(self)
         
-    def get_supported_formats(self) -> Dict[str, List[str]]:
+    def get_supported_formats(self) -> Mapping[str, FrozenSet[str]]:
         """Get supported input and output formats"""
-        return {
-            'video_input': ['mp4', 'avi', 'mkv', 'mov', 'wmv', 'flv', 'webm', '3gp', 'm4v'],
-            'video_output': ['mp4', 'avi', 'mkv', 'mov', 'webm', 'ogv'],
-            'audio_input': ['mp3', 'wav', 'flac', 'm4a', 'aac', 'ogg', 'wma'],
-            'audio_output': ['mp3', 'wav', 'flac', 'm4a', 'aac', 'ogg']
-        }
+        return _SUPPORTED_FORMATS
+    
+    def _probe_cache_key(
+        self,
+        file_path: str,
+        file_stat: Optional[os.stat_result] = None
+    ) -> Tuple[str, int, int]:
+        """Build a probe cache key that changes whenever the file does"""
+        st = file_stat or os.stat(file_path)
+        return (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
     
-    def get_file_info(self, file_path: str) -> Dict[str, Any]:
+    def get_file_info(
+        self,
+        file_path: str,
+        file_stat: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
         """Get information about a media file"""
         try:
+            cache_key = self._probe_cache_key(file_path, file_stat)
+            with self._probe_lock:
+                cached = self._probe_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
             probe = ffmpeg.probe(file_path)
             
             info = {
@@ -55,7 +221,7 @@ class FormatConverter:
                     stream_info.update({
                         'width': stream.get('width', 0),
                         'height': stream.get('height', 0),
-                        'fps': eval(stream.get('r_frame_rate', '0/1')) if stream.get('r_frame_rate') else 0
+                        'fps': _parse_ratio(stream['r_frame_rate']) if stream.get('r_frame_rate') else 0
                     })
                 elif stream['codec_type'] == 'audio':
                     stream_info.update({
@@ -65,10 +231,16 @@ class FormatConverter:
                 
                 info['streams'].append(stream_info)
             
+            # Drop the oldest entry once the cache is full
+            with self._probe_lock:
+                if len(self._probe_cache) >= PROBE_CACHE_SIZE:
+                    self._probe_cache.popitem(last=False)
+                self._probe_cache[cache_key] = info
+            
             return info
             
         except Exception as e:
-            self.logger.error(f"Error getting file info: {e}")
+            self.logger.error("Error getting file info: %s", e)
             raise Exception(f"Failed to get file information: {str(e)}")
     
     def convert_file(
@@ -79,72 +251,118 @@ class FormatConverter:
         quality: str = 'medium',
         custom_options: Optional[Dict[str, Any]] = None,
         progress_callback: Optional[Callable] = None,
-        completion_callback: Optional[Callable] = None
+        completion_callback: Optional[Callable] = None,
+        cancelled: Optional[threading.Event] = None
+    ) -> bool:
+        """Convert file to specified format
+        
+        Pass an Event as cancelled to be able to stop this conversion on its own.
+        """
+        if cancelled is None:
+            cancelled = self._new_cancel_event()
+        
+        return self._run_conversion(
+            input_path, output_path, output_format, quality,
+            custom_options, progress_callback, completion_callback, cancelled
+        )
+    
+    def _new_cancel_event(self) -> threading.Event:
+        """Create a job's cancel flag and register it with cancel_conversion()"""
+        cancelled = threading.Event()
+        with self.conversion_lock:
+            self.conversion_cancelled = False
+            self._cancel_events.add(cancelled)
+        return cancelled
+    
+    def _run_conversion(
+        self,
+        input_path: str,
+        output_path: str,
+        output_format: str,
+        quality: str,
+        custom_options: Optional[Dict[str, Any]],
+        progress_callback: Optional[Callable],
+        completion_callback: Optional[Callable],
+        cancelled: threading.Event,
+        input_stat: Optional[os.stat_result] = None
     ) -> bool:
-        """Convert file to specified format"""
+        """Run a single FFmpeg conversion, stopping once its cancel flag is set"""
+        process = None
         
         try:
-            with self.conversion_lock:
-                self.conversion_cancelled = False
-            
-            # Ensure input file exists
-            if not Path(input_path).exists():
-                raise FileNotFoundError(f"Input file not found: {input_path}")
+            # Ensure input file exists, keeping the stat for the probe cache
+            if input_stat is None:
+                try:
+                    input_stat = os.stat(input_path)
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"Input file not found: {input_path}")
             
             # Ensure output directory exists
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            output_dir = os.path.dirname(os.path.abspath(output_path))
+            os.makedirs(output_dir, exist_ok=True)
             
             # Get file info for progress tracking
-            file_info = self.get_file_info(input_path)
+            file_info = self.get_file_info(input_path, input_stat)
             total_duration = file_info.get('duration', 0)
             
-            # Build FFmpeg command
-            input_stream = ffmpeg.input(input_path)
+            # Apply conversion options based on format, quality and source codecs
+            input_codecs = tuple(stream['codec'] for stream in file_info.get('streams', []))
+            if custom_options:
+                output_args = _output_args(_freeze_options(self._get_conversion_options(
+                    output_format, quality, custom_options, input_codecs
+                )))
+            else:
+                output_args = self._plain_output_args(output_format, quality, input_codecs)
             
-            # Apply conversion options based on format and quality
-            output_options = self._get_conversion_options(output_format, quality, custom_options)
+            # Run conversion with progress tracking. Progress is emitted as
+            # key=value lines on stdout; stderr only carries errors so it
+            # cannot fill its pipe while we are reading stdout.
+            cmd = [
+                'ffmpeg', '-nostats', '-progress', 'pipe:1', '-loglevel', 'error',
+                '-i', input_path,
+                *output_args,
+                output_path, '-y'
+            ]
             
-            output_stream = ffmpeg.output(input_stream, output_path, **output_options)
-            
-            # Run conversion with progress tracking
-            cmd = ffmpeg.compile(output_stream, overwrite_output=True)
-            
-            self.logger.info(f"Starting conversion: {input_path} -> {output_path}")
-            self.logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+            self.logger.info("Starting conversion: %s -> %s", input_path, output_path)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("FFmpeg command: %s", ' '.join(cmd))
             
             # Start FFmpeg process
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                universal_newlines=True,
-                bufsize=1
+                bufsize=-1
             )
             
-            self.ffmpeg_process = process
+            with self.conversion_lock:
+                self._ffmpeg_processes.add(process)
+                if cancelled.is_set():
+                    process.terminate()
             
             # Monitor progress
             if progress_callback:
-                self._monitor_progress(process, total_duration, progress_callback)
+                self._monitor_progress(process, total_duration, progress_callback, cancelled)
             
             # Wait for completion
             stdout, stderr = process.communicate()
             
             # Check if cancelled
-            if self.conversion_cancelled:
+            if cancelled.is_set():
                 if completion_callback:
                     completion_callback(False, "Conversion cancelled by user")
                 return False
             
             # Check for errors
             if process.returncode != 0:
-                error_msg = f"FFmpeg error: {stderr}"
+                error_msg = f"FFmpeg error: {stderr.decode(errors='replace')}"
                 self.logger.error(error_msg)
                 if completion_callback:
                     completion_callback(False, error_msg)
                 return False
             
-            self.logger.info(f"Conversion completed: {output_path}")
+            self.logger.info("Conversion completed: %s", output_path)
             if completion_callback:
                 completion_callback(True, "Conversion completed successfully")
             
@@ -160,109 +378,145 @@ class FormatConverter:
             return False
         
         finally:
-            self.ffmpeg_process = None
+            with self.conversion_lock:
+                self._ffmpeg_processes.discard(process)
+                self._cancel_events.discard(cancelled)
+    
+    def _build_output_args(
+        self,
+        output_format: str,
+        quality: str,
+        input_codecs: Tuple[str, ...]
+    ) -> Tuple[str, ...]:
+        """Build output arguments for a conversion without custom options"""
+        return _output_args(_freeze_options(self._get_conversion_options(
+            output_format, quality, None, list(input_codecs)
+        )))
     
     def _get_conversion_options(
         self, 
         output_format: str, 
         quality: str, 
-        custom_options: Optional[Dict[str, Any]]
+        custom_options: Optional[Dict[str, Any]],
+        input_codecs: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """Get FFmpeg options for conversion"""
         
-        options = {}
+        fmt = output_format.lower()
+        custom_options = dict(custom_options or {})
+        force_reencode = custom_options.pop('force_reencode', False)
         
-        # Quality presets
-        quality_presets = {
-            'low': {'crf': 28, 'preset': 'fast'},
-            'medium': {'crf': 23, 'preset': 'medium'},
-            'high': {'crf': 18, 'preset': 'slow'},
-            'lossless': {'crf': 0, 'preset': 'veryslow'}
-        }
-        
-        # Format-specific options
-        if output_format.lower() in ['mp4', 'mkv', 'avi', 'mov', 'webm']:
-            # Video formats
-            preset = quality_presets.get(quality, quality_presets['medium'])
-            options.update({
-                'vcodec': 'libx264',
-                'crf': preset['crf'],
-                'preset': preset['preset'],
-                'acodec': 'aac',
-                'audio_bitrate': '128k'
-            })
-            
-        elif output_format.lower() in ['mp3', 'wav', 'flac', 'm4a', 'aac', 'ogg']:
-            # Audio formats
-            if output_format.lower() == 'mp3':
-                bitrate_map = {
-                    'low': '128k',
-                    'medium': '192k',
-                    'high': '320k',
-                    'lossless': '320k'
-                }
-                options.update({
-                    'acodec': 'libmp3lame',
-                    'audio_bitrate': bitrate_map.get(quality, '192k')
-                })
-            elif output_format.lower() == 'wav':
-                options.update({'acodec': 'pcm_s16le'})
-            elif output_format.lower() == 'flac':
-                options.update({'acodec': 'flac'})
-            elif output_format.lower() == 'm4a':
-                options.update({'acodec': 'aac'})
-            elif output_format.lower() == 'ogg':
-                options.update({'acodec': 'libvorbis'})
+        # Remux without re-encoding when the source streams fit the target container,
+        # unless a specific quality was picked
+        allowed_codecs = STREAM_COPY_CODECS.get(fmt)
+        if (not force_reencode and quality in STREAM_COPY_QUALITIES
+                and input_codecs and allowed_codecs
+                and all(codec in allowed_codecs for codec in input_codecs)):
+            options = {'c': 'copy'}
+        else:
+            builder = _FORMAT_BUILDERS.get(fmt)
+            options = builder(quality) if builder else {}
         
         # Apply custom options
-        if custom_options:
-            options.update(custom_options)
+        options.update(custom_options)
         
         return options
     
-    def _monitor_progress(self, process, total_duration: float, progress_callback: Callable):
-        """Monitor FFmpeg progress"""
+    def _monitor_progress(
+        self,
+        process,
+        total_duration: float,
+        progress_callback: Callable,
+        cancelled: threading.Event
+    ):
+        """Monitor FFmpeg progress from its -progress key=value output"""
         try:
-            while process.poll() is None:
-                if self.conversion_cancelled:
+            for line in self._read_progress_lines(process):
+                if cancelled.is_set():
                     process.terminate()
                     break
                 
-                # Read stderr for progress info
-                line = process.stderr.readline()
-                if line:
-                    # Parse time from FFmpeg output
-                    if 'time=' in line:
-                        try:
-                            time_str = line.split('time=')[1].split()[0]
-                            current_time = self._parse_time(time_str)
-                            
-                            if total_duration > 0:
-                                progress = min(current_time / total_duration, 1.0)
-                                progress_callback({
-                                    'progress': progress,
-                                    'current_time': current_time,
-                                    'total_time': total_duration,
-                                    'status': 'converting'
-                                })
-                        except Exception:
-                            pass
+                # Poll interval elapsed without output
+                if line is None:
+                    continue
+                
+                if total_duration <= 0:
+                    continue
+                
+                # FFmpeg's last block ends with progress=end, report completion even
+                # if the final out_time fell short of the probed duration
+                if line.startswith(b'progress=end'):
+                    progress_callback({
+                        'progress': 1.0,
+                        'current_time': total_duration,
+                        'total_time': total_duration,
+                        'status': 'converting'
+                    })
+                    continue
+                
+                if not line.startswith(b'out_time_us='):
+                    continue
+                
+                try:
+                    current_time = int(line[12:]) / 1_000_000
+                except ValueError:
+                    # FFmpeg reports N/A until the first frame is written
+                    continue
+                
+                progress_callback({
+                    'progress': min(current_time / total_duration, 1.0),
+                    'current_time': current_time,
+                    'total_time': total_duration,
+                    'status': 'converting'
+                })
                             
         except Exception as e:
-            self.logger.error(f"Error monitoring progress: {e}")
+            self.logger.error("Error monitoring progress: %s", e)
     
-    def _parse_time(self, time_str: str) -> float:
-        """Parse time string (HH:MM:SS.mmm) to seconds"""
-        try:
-            parts = time_str.split(':')
-            if len(parts) == 3:
-                hours = float(parts[0])
-                minutes = float(parts[1])
-                seconds = float(parts[2])
-                return hours * 3600 + minutes * 60 + seconds
-        except Exception:
-            pass
-        return 0.0
+    def _read_progress_lines(self, process) -> Iterator[Optional[bytes]]:
+        """Yield FFmpeg progress lines, or None each time the poll interval passes quietly"""
+        if os.name == 'nt':
+            # Windows cannot select() on pipes, so read them from a helper thread
+            yield from self._read_progress_lines_threaded(process)
+            return
+        
+        fd = process.stdout.fileno()
+        pending = b''
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while True:
+                if not selector.select(timeout=PROGRESS_POLL_INTERVAL):
+                    yield None
+                    continue
+                
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                
+                *lines, pending = (pending + chunk).split(b'\n')
+                yield from lines
+    
+    def _read_progress_lines_threaded(self, process) -> Iterator[Optional[bytes]]:
+        """Yield FFmpeg progress lines read by a background thread"""
+        lines: queue.Queue = queue.Queue()
+        
+        def reader():
+            for line in iter(process.stdout.readline, b''):
+                lines.put(line)
+            lines.put(b'')
+        
+        threading.Thread(target=reader, daemon=True).start()
+        
+        while True:
+            try:
+                line = lines.get(timeout=PROGRESS_POLL_INTERVAL)
+            except queue.Empty:
+                yield None
+                continue
+            
+            if not line:
+                break
+            yield line
     
     def convert_file_async(
         self,
@@ -273,52 +527,118 @@ class FormatConverter:
         custom_options: Optional[Dict[str, Any]] = None,
         progress_callback: Optional[Callable] = None,
         completion_callback: Optional[Callable] = None
-    ) -> threading.Thread:
-        """Convert file asynchronously"""
+    ) -> Future:
+        """Convert file asynchronously on the shared conversion pool"""
+        # Registered now so cancelling also stops it while it waits for a worker
+        cancelled = self._new_cancel_event()
+        future = self._get_pool().submit(
+            self.convert_file,
+            input_path, output_path, output_format, quality,
+            custom_options, progress_callback, completion_callback, cancelled
+        )
+        self.current_conversion = future
+        # Tracked with the batch jobs so cancelling also drops it while still queued
+        self._batch_futures.add(future)
         
-        def conversion_thread():
-            self.convert_file(
-                input_path, output_path, output_format, quality,
-                custom_options, progress_callback, completion_callback
-            )
+        return future
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Get the worker pool shared by single and batch conversions, creating it on first use"""
+        with self.conversion_lock:
+            if self._batch_pool is None:
+                # libx264 already threads each encode, so use half the cores for jobs
+                self._batch_pool = ThreadPoolExecutor(
+                    max_workers=max(1, (os.cpu_count() or 2) // 2),
+                    thread_name_prefix="ConvertWorker"
+                )
+            return self._batch_pool
+    
+    def submit_batch(
+        self,
+        jobs: List[ConversionJob],
+        progress_callback: Optional[Callable] = None,
+        completion_callback: Optional[Callable] = None
+    ) -> List[Future]:
+        """Convert several files in parallel, one FFmpeg process per worker
+        
+        Set a job's cancelled event to stop just that job.
+        """
+        with self.conversion_lock:
+            self.conversion_cancelled = False
+            self._cancel_events.update(job.cancelled for job in jobs)
+        pool = self._get_pool()
         
-        thread = threading.Thread(target=conversion_thread, daemon=True)
-        thread.start()
-        self.current_conversion = thread
+        def run_job(job: ConversionJob) -> bool:
+            return self._run_conversion(
+                job.input_path, job.output_path, job.output_format, job.quality,
+                job.custom_options,
+                (lambda info: progress_callback(job, info)) if progress_callback else None,
+                (lambda ok, msg: completion_callback(job, ok, msg)) if completion_callback else None,
+                job.cancelled,
+                job.input_stat
+            )
         
-        return thread
+        futures = [pool.submit(run_job, job) for job in jobs]
+        self._batch_futures.update(futures)
+        return futures
     
     def cancel_conversion(self):
-        """Cancel current conversion"""
+        """Cancel every queued and running conversion"""
         try:
             with self.conversion_lock:
                 self.conversion_cancelled = True
+                for cancelled in list(self._cancel_events):
+                    cancelled.set()
+                processes = list(self._ffmpeg_processes)
             
             self.logger.info("Conversion cancellation requested")
             
-            if self.ffmpeg_process:
+            # Drop queued batch jobs before stopping the running ones
+            for future in list(self._batch_futures):
+                future.cancel()
+            
+            for process in processes:
                 try:
-                    self.ffmpeg_process.terminate()
+                    process.terminate()
                     self.logger.info("FFmpeg process terminated")
                 except Exception as e:
-                    self.logger.error(f"Error terminating FFmpeg: {e}")
+                    self.logger.error("Error terminating FFmpeg: %s", e)
             
             return True
             
         except Exception as e:
-            self.logger.error(f"Error cancelling conversion: {e}")
+            self.logger.error("Error cancelling conversion: %s", e)
             return False
     
+    def shutdown(self):
+        """Shut down the conversion pool without waiting, dropping queued jobs"""
+        with self.conversion_lock:
+            pool = self._batch_pool
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    
     def is_conversion_active(self) -> bool:
         """Check if a conversion is currently active"""
-        return (self.current_conversion and 
-                self.current_conversion.is_alive() and 
-                not self.conversion_cancelled)
+        if self.conversion_cancelled:
+            return False
+        if self.current_conversion and not self.current_conversion.done():
+            return True
+        return any(not future.done() for future in list(self._batch_futures))
     
     def get_conversion_status(self) -> Dict[str, Any]:
         """Get current conversion status"""
         return {
             'active': self.is_conversion_active(),
             'cancelled': self.conversion_cancelled,
-            'thread_alive': self.current_conversion.is_alive() if self.current_conversion else False
+            'thread_alive': not self.current_conversion.done() if self.current_conversion else False
         }
+
+def shutdown_converters():
+    """Cancel every live converter's jobs and terminate their FFmpeg processes"""
+    for converter in list(_live_converters):
+        # Set every job's cancel flag and terminate the running FFmpeg processes,
+        # then drop the jobs still waiting for a pool worker
+        converter.cancel_conversion()
+        converter.shutdown()
+
+atexit.register(shutdown_converters)
@@ -3,58 +3,135 @@ Audio downloader module for YTDL application
 """
 
 import yt_dlp
+import hashlib
 import os
+import subprocess
 import threading
+import time
 from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 from typing import Dict, Any, Callable, Optional, List
-from mutagen.mp3 import MP3
-from mutagen.id3 import ID3, TIT2, TPE1, TALB, TDRC, APIC
+from mutagen.id3 import ID3, ID3NoHeaderError, TIT2, TPE1, TALB, TDRC, APIC
 import requests
+from requests.adapters import HTTPAdapter
+from yt_dlp.postprocessor.embedthumbnail import EmbedThumbnailPPError
+from ..utils.cache import TTLCache
 from ..utils.config import Config
 from ..utils.logger import get_logger
+from .download_handle import DownloadHandle
+
+# Query parameters that only track where a link was shared from
+TRACKING_PARAMS = frozenset({'si', 'feature', 'pp', 'fbclid', 'gclid', 'igshid', 'ref'})
+
+# Metadata lookups shared by every AudioDownloader
+_info_cache = TTLCache(maxsize=512, ttl=1800)
+
+# Downloaded cover art, reused across runs for this long (seconds)
+THUMBNAIL_CACHE_DIR = Path.home() / '.ytdl' / 'cache' / 'thumbnails'
+THUMBNAIL_CACHE_TTL = 30 * 24 * 3600
+
+# Progress updates closer together than this (seconds, fraction) are dropped
+PROGRESS_INTERVAL = 0.1
+PROGRESS_STEP = 0.01
+
+# Keep-alive session shared by every AudioDownloader for thumbnail fetches
+_http = requests.Session()
+_http.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+_http.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL for cache lookups by dropping tracking parameters"""
+    parsed = urlparse(url.strip())
+    query = [
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key not in TRACKING_PARAMS and not key.startswith('utm_')
+    ]
+    netloc = parsed.netloc.lower()
+    if netloc.startswith('www.'):
+        netloc = netloc[4:]
+    return urlunparse(parsed._replace(netloc=netloc, query=urlencode(query), fragment=''))
 
 class AudioDownloader:
     """Audio downloader using yt-dlp with metadata support"""
     
+    # yt-dlp options that are the same for every call
+    _BASE_YDL_OPTS = MappingProxyType({
+        'format': 'bestaudio/best',
+        'ignoreerrors': False,
+        'no_warnings': False,
+    })
+    _FORMATS_YDL_OPTS = MappingProxyType({
+        'quiet': True,
+        'no_warnings': True,
+    })
+    # Display metadata doesn't need the streaming manifests
+    _META_YDL_OPTS = MappingProxyType({
+        **_FORMATS_YDL_OPTS,
+        'extract_flat': 'in_playlist',
+        'youtube_include_dash_manifest': False,
+        'youtube_include_hls_manifest': False,
+        'extractor_args': {'youtube': {'skip': ['dash', 'hls']}},
+    })
+    
     def __init__(self, config: Config):
         self.config = config
         self.logger = get_logger()
         self.current_download = None
-        self.download_cancelled = False
-        self.ydl_process = None
-        self.download_lock = threading.Lock()
+        self.current_handle: Optional[DownloadHandle] = None
+        self._http = _http
+        self._local = threading.local()
+        
+    def _info_ydl(self, need_formats: bool) -> yt_dlp.YoutubeDL:
+        """Get this thread's YoutubeDL for metadata lookups, creating it on first use"""
+        attr = 'formats_ydl' if need_formats else 'info_ydl'
+        ydl = getattr(self._local, attr, None)
+        if ydl is None:
+            ydl_opts = self._FORMATS_YDL_OPTS if need_formats else self._META_YDL_OPTS
+            ydl = yt_dlp.YoutubeDL(dict(ydl_opts))
+            setattr(self._local, attr, ydl)
+        return ydl
+    
+    def get_audio_info(self, url: str, need_formats: bool = True) -> Dict[str, Any]:
+        """Get audio information without downloading
+        
+        Pass need_formats=False when only the metadata is needed, which skips
+        the DASH/HLS manifests and leaves the format list empty.
+        """
+        cache_key = normalize_url(url)
+        cached = _info_cache.get(cache_key)
+        if cached is None and not need_formats:
+            cached = _info_cache.get(f"{cache_key}#meta")
+        if cached is not None:
+            return cached
         
-    def get_audio_info(self, url: str) -> Dict[str, Any]:
-        """Get audio information without downloading"""
         try:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': False,
-            }
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                
-                return {
-                    'title': info.get('title', 'Unknown'),
-                    'artist': info.get('uploader', info.get('artist', 'Unknown')),
-                    'album': info.get('album', ''),
-                    'duration': info.get('duration', 0),
-                    'view_count': info.get('view_count', 0),
-                    'like_count': info.get('like_count', 0),
-                    'thumbnail': info.get('thumbnail'),
-                    'description': info.get('description', ''),
-                    'upload_date': info.get('upload_date'),
-                    'formats': self._extract_audio_formats(info.get('formats', [])),
-                    'genre': info.get('genre', ''),
-                    'release_year': info.get('release_year', ''),
-                }
+            info = self._info_ydl(need_formats).extract_info(url, download=False)
+            audio_info = self._build_audio_info(info, need_formats)
+            _info_cache.set(cache_key if need_formats else f"{cache_key}#meta", audio_info)
+            return audio_info
                 
         except Exception as e:
-            self.logger.error(f"Error getting audio info: {e}")
+            self.logger.error("Error getting audio info: %s", e)
             raise Exception(f"Failed to get audio information: {str(e)}")
     
+    def _build_audio_info(self, info: Dict[str, Any], need_formats: bool = True) -> Dict[str, Any]:
+        """Build the audio info dict from a yt-dlp info dict"""
+        return {
+            'title': info.get('title', 'Unknown'),
+            'artist': info.get('uploader', info.get('artist', 'Unknown')),
+            'album': info.get('album', ''),
+            'duration': info.get('duration', 0),
+            'view_count': info.get('view_count', 0),
+            'like_count': info.get('like_count', 0),
+            'thumbnail': info.get('thumbnail'),
+            'description': info.get('description', ''),
+            'upload_date': info.get('upload_date'),
+            'formats': self._extract_audio_formats(info.get('formats', [])) if need_formats else [],
+            'genre': info.get('genre', ''),
+            'release_year': info.get('release_year', ''),
+        }
+    
     def _extract_audio_formats(self, formats: List[Dict]) -> List[Dict[str, Any]]:
         """Extract and organize available audio formats"""
         audio_formats = []
@@ -80,78 +157,137 @@ class AudioDownloader:
         format_ext: str = 'mp3',
         add_metadata: bool = True,
         progress_callback: Optional[Callable] = None,
-        completion_callback: Optional[Callable] = None
+        completion_callback: Optional[Callable] = None,
+        audio_info: Optional[Dict[str, Any]] = None,
+        handle: Optional[DownloadHandle] = None
     ) -> bool:
-        """Download audio with specified options"""
+        """Download audio with specified options
+        
+        Metadata is taken from the download itself; pass audio_info from an
+        earlier get_audio_info call to use that instead. Pass a handle to be
+        able to cancel this particular download.
+        """
+        
+        if handle is None:
+            handle = DownloadHandle()
+        # Bound once, the hooks below check it on every chunk
+        is_cancelled = handle.cancelled.is_set
+        
+        # Last emitted (time, progress), smaller updates are dropped
+        last_emit = [0.0, -1.0]
         
         def progress_hook(d):
             # Check for cancellation
-            if self.download_cancelled:
+            if is_cancelled():
                 raise yt_dlp.DownloadError("Download cancelled by user")
-                
-            if progress_callback and d['status'] == 'downloading':
-                try:
-                    if 'total_bytes' in d:
-                        progress = d['downloaded_bytes'] / d['total_bytes']
-                    elif 'total_bytes_estimate' in d:
-                        progress = d['downloaded_bytes'] / d['total_bytes_estimate']
-                    else:
-                        progress = 0
-                    
-                    progress_callback({
-                        'progress': progress,
-                        'downloaded': d.get('downloaded_bytes', 0),
-                        'total': d.get('total_bytes', d.get('total_bytes_estimate', 0)),
-                        'speed': d.get('speed', 0),
-                        'eta': d.get('eta', 0),
-                        'filename': d.get('filename', ''),
-                        'status': d.get('status', 'downloading')
-                    })
-                except Exception as e:
-                    self.logger.error(f"Error in progress callback: {e}")
+            
+            if progress_callback is None or d['status'] != 'downloading':
+                return
+            
+            downloaded = d.get('downloaded_bytes') or 0
+            total = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
+            progress = downloaded / total if total else 0.0
+            
+            now = time.monotonic()
+            # The final chunk always goes through so the UI can reach 100%
+            if (progress < 1.0
+                    and now - last_emit[0] < PROGRESS_INTERVAL
+                    and abs(progress - last_emit[1]) < PROGRESS_STEP):
+                return
+            last_emit[0] = now
+            last_emit[1] = progress
+            
+            try:
+                progress_callback({
+                    'progress': progress,
+                    'downloaded': downloaded,
+                    'total': total,
+                    'speed': d.get('speed', 0),
+                    'eta': d.get('eta', 0),
+                    'filename': d.get('filename', ''),
+                    'status': 'downloading'
+                })
+            except Exception as e:
+                self.logger.error("Error in progress callback: %s", e)
         
-        try:
-            with self.download_lock:
-                self.download_cancelled = False
+        # Path of the file the postprocessors are working on
+        current_file = {}
+        
+        def postprocessor_hook(d):
+            # Stop before the next conversion step once cancelled
+            if is_cancelled():
+                raise yt_dlp.DownloadError("Download cancelled by user")
             
+            info_dict = d.get('info_dict', {})
+            if info_dict.get('filepath'):
+                current_file['path'] = info_dict['filepath']
+            for thumbnail in reversed(info_dict.get('thumbnails') or []):
+                if thumbnail.get('filepath'):
+                    current_file['thumbnail'] = thumbnail['filepath']
+                    break
+        
+        try:
             # Ensure output directory exists
             Path(output_path).mkdir(parents=True, exist_ok=True)
             
+            format_ext = format_ext.lower()
+            embed_thumbnail = add_metadata and format_ext == 'mp3'
+            
+            postprocessors = [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': format_ext,
+                'preferredquality': quality,
+            }]
+            if add_metadata:
+                postprocessors.append({'key': 'FFmpegMetadata', 'add_metadata': True})
+            if embed_thumbnail:
+                # Embeds the thumbnail yt-dlp already wrote instead of fetching it again
+                postprocessors.append({'key': 'EmbedThumbnail', 'already_have_thumbnail': False})
+            
             # Configure yt-dlp options for audio
             ydl_opts = {
+                **self._BASE_YDL_OPTS,
                 'outtmpl': os.path.join(output_path, '%(title)s.%(ext)s'),
                 'progress_hooks': [progress_hook],
-                'format': 'bestaudio/best',
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': format_ext.lower(),
-                    'preferredquality': quality,
-                }],
-                'writeinfojson': add_metadata,
+                'postprocessor_hooks': [postprocessor_hook],
+                'postprocessors': postprocessors,
+                # The sidecar is only written on request, nothing here reads it back
+                'writeinfojson': add_metadata and self.config.get('write_info_json', False),
                 'writethumbnail': add_metadata,
-                'embedthumbnail': add_metadata and format_ext.lower() == 'mp3',
-                'ignoreerrors': False,
-                'no_warnings': False,
             }
             
-            # Get audio info for metadata
-            audio_info = None
-            if add_metadata:
-                try:
-                    audio_info = self.get_audio_info(url)
-                except Exception as e:
-                    self.logger.warning(f"Could not get audio info for metadata: {e}")
+            needs_tagging = False
+            try:
+                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                    handle.ydl = ydl
+                    info = ydl.extract_info(url, download=True)
+            except yt_dlp.DownloadError as e:
+                # yt-dlp reports a failed postprocessor as a DownloadError wrapping it,
+                # when only the cover art step failed the audio is already converted
+                if not isinstance((e.exc_info or (None, None))[1], EmbedThumbnailPPError):
+                    raise
+                self.logger.warning("Could not embed thumbnail, tagging with ffmpeg: %s", e)
+                info = None
+                needs_tagging = True
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                self.ydl_process = ydl
-                ydl.download([url])
+            # Reuse the metadata yt-dlp already fetched for the download
+            if add_metadata and audio_info is None and info:
+                audio_info = self._build_audio_info(info)
+                _info_cache.set(normalize_url(url), audio_info)
             
-            # Add metadata if requested and format is MP3
-            if add_metadata and format_ext.lower() == 'mp3' and audio_info:
-                self._add_mp3_metadata(output_path, audio_info)
+            if needs_tagging and current_file.get('path'):
+                if audio_info is None:
+                    audio_info = self.get_audio_info(url, need_formats=False)
+                self._add_mp3_metadata(current_file['path'], audio_info, current_file.get('thumbnail'))
+                # EmbedThumbnail would have removed the image, it stopped before that
+                if current_file.get('thumbnail'):
+                    try:
+                        os.remove(current_file['thumbnail'])
+                    except OSError:
+                        pass
             
             # Check if cancelled during download
-            if self.download_cancelled:
+            if handle.is_cancelled:
                 if completion_callback:
                     completion_callback(False, "Download cancelled by user")
                 return False
@@ -184,54 +320,139 @@ class AudioDownloader:
             return False
         
         finally:
-            self.ydl_process = None
+            handle.ydl = None
     
-    def _add_mp3_metadata(self, output_path: str, audio_info: Dict[str, Any]):
-        """Add metadata to MP3 files"""
+    def _add_mp3_metadata(
+        self,
+        mp3_path: str,
+        audio_info: Dict[str, Any],
+        thumbnail_path: Optional[str] = None
+    ):
+        """Add metadata to a downloaded MP3 file
+        
+        A thumbnail yt-dlp already wrote to disk is used as album art before
+        falling back to fetching it again.
+        """
         try:
-            # Find the downloaded MP3 file
-            mp3_files = list(Path(output_path).glob("*.mp3"))
-            if not mp3_files:
+            mp3_file = Path(mp3_path)
+            if not mp3_file.exists():
                 return
             
-            mp3_file = mp3_files[-1]  # Get the most recent file
-            
-            # Load the MP3 file
-            audio = MP3(str(mp3_file), ID3=ID3)
-            
-            # Add ID3 tags if they don't exist
-            if audio.tags is None:
-                audio.add_tags()
-            
-            # Set metadata
-            audio.tags.add(TIT2(encoding=3, text=audio_info.get('title', '')))
-            audio.tags.add(TPE1(encoding=3, text=audio_info.get('artist', '')))
-            audio.tags.add(TALB(encoding=3, text=audio_info.get('album', '')))
-            
-            if audio_info.get('release_year'):
-                audio.tags.add(TDRC(encoding=3, text=str(audio_info['release_year'])))
-            
-            # Add thumbnail as album art
-            if audio_info.get('thumbnail'):
+            cover_path = None
+            if thumbnail_path and os.path.exists(thumbnail_path):
+                cover_path = Path(thumbnail_path)
+            elif audio_info.get('thumbnail'):
                 try:
-                    response = requests.get(audio_info['thumbnail'], timeout=10)
-                    if response.status_code == 200:
-                        audio.tags.add(APIC(
-                            encoding=3,
-                            mime='image/jpeg',
-                            type=3,  # Cover (front)
-                            desc='Cover',
-                            data=response.content
-                        ))
+                    cover_path = self._cached_thumbnail(audio_info['thumbnail'])
                 except Exception as e:
-                    self.logger.warning(f"Could not add album art: {e}")
+                    self.logger.warning("Could not add album art: %s", e)
+            
+            try:
+                self._write_mp3_tags_ffmpeg(mp3_file, audio_info, cover_path)
+            except FileNotFoundError:
+                # ffmpeg is not installed, tag in Python instead
+                cover = cover_path.read_bytes() if cover_path else None
+                self._write_mp3_tags_mutagen(mp3_file, audio_info, cover)
             
-            # Save the file
-            audio.save()
-            self.logger.info(f"Added metadata to {mp3_file}")
+            self.logger.info("Added metadata to %s", mp3_file)
             
         except Exception as e:
-            self.logger.error(f"Error adding MP3 metadata: {e}")
+            self.logger.error("Error adding MP3 metadata: %s", e)
+    
+    def _cached_thumbnail(self, url: str) -> Optional[Path]:
+        """Get a thumbnail from the on-disk cache, downloading it if missing or stale"""
+        cache_file = THUMBNAIL_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.img"
+        
+        try:
+            if time.time() - cache_file.stat().st_mtime < THUMBNAIL_CACHE_TTL:
+                return cache_file
+        except FileNotFoundError:
+            pass
+        
+        response = self._http.get(url, timeout=10)
+        if response.status_code != 200:
+            return None
+        
+        # Write under a unique name and rename, so concurrent workers never see a partial file
+        THUMBNAIL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}")
+        temp_file.write_bytes(response.content)
+        os.replace(temp_file, cache_file)
+        return cache_file
+    
+    def _write_mp3_tags_ffmpeg(
+        self,
+        mp3_file: Path,
+        audio_info: Dict[str, Any],
+        cover_path: Optional[Path] = None
+    ):
+        """Write ID3 tags with a single ffmpeg stream-copy pass"""
+        temp_file = mp3_file.with_name(f"{mp3_file.stem}.tagging.mp3")
+        
+        cmd = ['ffmpeg', '-y', '-loglevel', 'error', '-i', str(mp3_file)]
+        if cover_path:
+            # ffmpeg reads cover art straight from disk, only the small image gets re-encoded
+            cmd += [
+                '-i', str(cover_path),
+                '-map', '0:a', '-map', '1:v',
+                '-c:a', 'copy', '-c:v', 'mjpeg',
+                '-disposition:v', 'attached_pic',
+                '-metadata:s:v', 'title=Cover',
+                '-metadata:s:v', 'comment=Cover (front)',
+            ]
+        else:
+            cmd += ['-map', '0:a', '-c', 'copy']
+        
+        cmd += ['-id3v2_version', '3']
+        for key, value in (
+            ('title', audio_info.get('title')),
+            ('artist', audio_info.get('artist')),
+            ('album', audio_info.get('album')),
+            ('date', audio_info.get('release_year')),
+        ):
+            if value:
+                cmd += ['-metadata', f'{key}={value}']
+        cmd += ['-f', 'mp3', str(temp_file)]
+        
+        try:
+            subprocess.run(cmd, capture_output=True, check=True)
+            os.replace(temp_file, mp3_file)
+        finally:
+            if temp_file.exists():
+                temp_file.unlink()
+    
+    def _write_mp3_tags_mutagen(self, mp3_file: Path, audio_info: Dict[str, Any], cover: Optional[bytes]):
+        """Write ID3 tags with mutagen"""
+        # Only the ID3 header is read, the MPEG stream is never scanned
+        try:
+            tags = ID3(str(mp3_file))
+        except ID3NoHeaderError:
+            tags = ID3()
+        
+        frames = [
+            TIT2(encoding=3, text=audio_info.get('title', '')),
+            TPE1(encoding=3, text=audio_info.get('artist', '')),
+            TALB(encoding=3, text=audio_info.get('album', '')),
+        ]
+        if audio_info.get('release_year'):
+            frames.append(TDRC(encoding=3, text=str(audio_info['release_year'])))
+        if cover:
+            frames.append(APIC(
+                encoding=3,
+                mime='image/jpeg',
+                type=3,  # Cover (front)
+                desc='Cover',
+                data=cover
+            ))
+        for frame in frames:
+            tags.add(frame)
+        
+        # Save in place when the new tags fit, otherwise leave room for later edits
+        tags.save(
+            str(mp3_file),
+            v2_version=3,
+            padding=lambda info: info.padding if info.padding >= 0 else 4096
+        )
     
     def download_audio_async(
         self,
@@ -241,55 +462,55 @@ class AudioDownloader:
         format_ext: str = 'mp3',
         add_metadata: bool = True,
         progress_callback: Optional[Callable] = None,
-        completion_callback: Optional[Callable] = None
+        completion_callback: Optional[Callable] = None,
+        audio_info: Optional[Dict[str, Any]] = None
     ) -> threading.Thread:
         """Download audio asynchronously"""
         
+        handle = DownloadHandle()
+        
         def download_thread():
             self.download_audio(
                 url, output_path, quality, format_ext, add_metadata,
-                progress_callback, completion_callback
+                progress_callback, completion_callback, audio_info, handle
             )
         
         thread = threading.Thread(target=download_thread, daemon=True)
+        self.current_handle = handle
         thread.start()
         self.current_download = thread
         
         return thread
     
-    def cancel_download(self):
-        """Cancel current download"""
+    def cancel_download(self, handle: Optional[DownloadHandle] = None):
+        """Cancel a download, the one started by download_audio_async by default"""
         try:
-            with self.download_lock:
-                self.download_cancelled = True
+            handle = handle or self.current_handle
+            if handle is None:
+                return False
             
+            handle.cancel()
             self.logger.info("Audio download cancellation requested")
             
-            if self.ydl_process:
-                try:
-                    self.logger.info("Interrupting yt-dlp process")
-                except Exception as e:
-                    self.logger.error(f"Error interrupting yt-dlp: {e}")
-            
             if self.current_download and self.current_download.is_alive():
                 self.logger.info("Waiting for download thread to stop...")
                 
             return True
             
         except Exception as e:
-            self.logger.error(f"Error cancelling download: {e}")
+            self.logger.error("Error cancelling download: %s", e)
             return False
     
     def is_download_active(self) -> bool:
         """Check if a download is currently active"""
         return (self.current_download and 
                 self.current_download.is_alive() and 
-                not self.download_cancelled)
+                not (self.current_handle and self.current_handle.is_cancelled))
     
     def get_download_status(self) -> Dict[str, Any]:
         """Get current download status"""
         return {
             'active': self.is_download_active(),
-            'cancelled': self.download_cancelled,
+            'cancelled': bool(self.current_handle and self.current_handle.is_cancelled),
             'thread_alive': self.current_download.is_alive() if self.current_download else False
         }
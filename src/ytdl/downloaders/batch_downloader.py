@@ -2,16 +2,26 @@
 Batch downloader module for YTDL application
 """
 
+import itertools
 import threading
 import time
-from queue import Queue, Empty
+import yt_dlp
+from collections import deque
 from typing import Dict, Any, Callable, Optional, List
-from dataclasses import dataclass
+from urllib.parse import urlparse
+from dataclasses import dataclass, field
 from enum import Enum
 from ..utils.config import Config
 from ..utils.logger import get_logger
 from .video_downloader import VideoDownloader
 from .audio_downloader import AudioDownloader
+from .download_handle import DownloadHandle
+
+# Progress updates are coalesced per item and delivered this often (seconds)
+PROGRESS_FLUSH_INTERVAL = 0.1
+
+# URL path fragments that identify playlist-like pages
+PLAYLIST_PATH_MARKERS = ('/playlist', '/sets/', '/album/')
 
 class DownloadType(Enum):
     VIDEO = "video"
@@ -38,6 +48,7 @@ class DownloadItem:
     error_message: str = ""
     filename: str = ""
     add_metadata: bool = True
+    handle: Optional[DownloadHandle] = field(default=None, repr=False, compare=False)
 
 class BatchDownloader:
     """Batch downloader with queue management"""
@@ -50,22 +61,42 @@ class BatchDownloader:
         self.video_downloader = VideoDownloader(config)
         self.audio_downloader = AudioDownloader(config)
         
-        # Queue management
-        self.download_queue = Queue()
+        # Queue management, finished items only keep a rolling history
+        # while the counters below track the totals
+        history_size = config.get('history_size', 500)
+        self.download_queue: "deque[DownloadItem]" = deque()
         self.active_downloads: Dict[str, DownloadItem] = {}
-        self.completed_downloads: List[DownloadItem] = []
-        self.failed_downloads: List[DownloadItem] = []
+        self.completed_downloads: "deque[DownloadItem]" = deque(maxlen=history_size)
+        self.failed_downloads: "deque[DownloadItem]" = deque(maxlen=history_size)
+        self.completed_count = 0
+        self.failed_count = 0
+        self._id_counter = itertools.count()
+        
+        # Bulk adds beyond the pending limit are fed in by a background thread
+        self._feed_backlog = 0
+        self._feed_generation = 0
         
         # Threading
         self.worker_threads: List[threading.Thread] = []
         self.max_concurrent = config.get('concurrent_downloads', 3)
         self.is_running = False
         self.queue_lock = threading.Lock()
+        self.queue_ready = threading.Condition(self.queue_lock)
+        self.queue_space = threading.Condition(self.queue_lock)
         
         # Callbacks
         self.progress_callback: Optional[Callable] = None
         self.status_callback: Optional[Callable] = None
         
+        # Latest progress per item ID, waiting to be delivered
+        self._pending_progress: Dict[str, tuple] = {}
+        self._progress_lock = threading.Lock()
+        self._dispatcher: Optional[threading.Thread] = None
+        
+        # Playlist expansion reuses one YoutubeDL, created on first use
+        self._expand_ydl: Optional[yt_dlp.YoutubeDL] = None
+        self._expand_lock = threading.Lock()
+        
     def set_callbacks(
         self, 
         progress_callback: Optional[Callable] = None,
@@ -82,12 +113,13 @@ class BatchDownloader:
         download_type: DownloadType,
         quality: str = 'best',
         format_ext: str = 'mp4',
-        add_metadata: bool = True
+        add_metadata: bool = True,
+        download_id: Optional[str] = None
     ) -> str:
         """Add a download to the queue"""
         
-        # Generate unique ID
-        download_id = f"{download_type.value}_{int(time.time() * 1000)}"
+        if download_id is None:
+            download_id = self._new_download_id(download_type)
         
         item = DownloadItem(
             id=download_id,
@@ -99,8 +131,10 @@ class BatchDownloader:
             add_metadata=add_metadata
         )
         
-        self.download_queue.put(item)
-        self.logger.info(f"Added download to queue: {url}")
+        with self.queue_ready:
+            self.download_queue.append(item)
+            self.queue_ready.notify()
+        self.logger.info("Added download to queue: %s", url)
         
         # Notify status callback
         if self.status_callback:
@@ -108,6 +142,15 @@ class BatchDownloader:
         
         return download_id
     
+    def _new_download_id(self, download_type: DownloadType) -> str:
+        """Generate a unique download ID"""
+        # count() advances atomically, so IDs stay unique across threads
+        return f"{download_type.value}_{next(self._id_counter)}"
+    
+    def _max_pending(self) -> int:
+        """Number of items allowed to wait in the queue at once"""
+        return max(64, 4 * self.max_concurrent)
+    
     def add_video_download(
         self,
         url: str,
@@ -133,13 +176,100 @@ class BatchDownloader:
             url, output_path, DownloadType.AUDIO, quality, format_ext, add_metadata
         )
     
-    def add_bulk_downloads(self, urls: List[str], **kwargs) -> List[str]:
-        """Add multiple downloads at once"""
-        download_ids = []
+    def add_bulk_downloads(
+        self,
+        urls: List[str],
+        output_path: str,
+        download_type: DownloadType = DownloadType.VIDEO,
+        expand_playlists: bool = True,
+        **kwargs
+    ) -> List[str]:
+        """Add multiple downloads at once, expanding playlists into their entries
+        
+        Only as many items as the pending limit allows are queued right away,
+        the rest are fed in by a background thread as workers free up room.
+        Other keyword arguments are passed on to add_download.
+        """
+        entry_urls = []
         for url in urls:
-            download_id = self.add_download(url, **kwargs)
-            download_ids.append(download_id)
-        return download_ids
+            if expand_playlists and self._is_playlist_url(url):
+                entry_urls.extend(self._flat_expand(url))
+            else:
+                entry_urls.append(url)
+        
+        kwargs.update(output_path=output_path, download_type=download_type)
+        entries = [(entry_url, self._new_download_id(download_type)) for entry_url in entry_urls]
+        
+        with self.queue_lock:
+            room = max(0, self._max_pending() - len(self.download_queue))
+        
+        for entry_url, download_id in entries[:room]:
+            self.add_download(entry_url, download_id=download_id, **kwargs)
+        
+        backlog = entries[room:]
+        if backlog:
+            with self.queue_lock:
+                self._feed_backlog += len(backlog)
+                generation = self._feed_generation
+            
+            threading.Thread(
+                target=self._feed_downloads,
+                args=(backlog, kwargs, generation),
+                name="BatchFeeder",
+                daemon=True
+            ).start()
+        
+        return [download_id for _, download_id in entries]
+    
+    def _feed_downloads(self, backlog: List[tuple], kwargs: Dict[str, Any], generation: int):
+        """Queue backlog items as room frees up, until the batch is stopped"""
+        for entry_url, download_id in backlog:
+            with self.queue_space:
+                self.queue_space.wait_for(
+                    lambda: len(self.download_queue) < self._max_pending()
+                    or generation != self._feed_generation
+                )
+                if generation != self._feed_generation:
+                    return
+                self._feed_backlog -= 1
+            
+            self.add_download(entry_url, download_id=download_id, **kwargs)
+    
+    def _is_playlist_url(self, url: str) -> bool:
+        """Check whether a URL points at a playlist rather than a single item"""
+        parsed = urlparse(url)
+        return 'list=' in parsed.query or any(marker in parsed.path for marker in PLAYLIST_PATH_MARKERS)
+    
+    def _flat_expand(self, url: str) -> List[str]:
+        """Resolve a playlist to its entry URLs without extracting every entry"""
+        try:
+            # YoutubeDL instances aren't safe to share, callers take turns
+            with self._expand_lock:
+                if self._expand_ydl is None:
+                    self._expand_ydl = yt_dlp.YoutubeDL({
+                        'quiet': True,
+                        'no_warnings': True,
+                        'skip_download': True,
+                        'extract_flat': 'in_playlist',
+                        'youtube_include_dash_manifest': False,
+                    })
+                info = self._expand_ydl.extract_info(url, download=False)
+        except Exception as e:
+            self.logger.warning("Could not expand playlist %s: %s", url, e)
+            return [url]
+        
+        entries = (info or {}).get('entries') or []
+        entry_urls = [
+            entry.get('webpage_url') or entry.get('url')
+            for entry in entries if entry
+        ]
+        entry_urls = [entry_url for entry_url in entry_urls if entry_url]
+        
+        if not entry_urls:
+            return [url]
+        
+        self.logger.info("Expanded playlist %s into %s items", url, len(entry_urls))
+        return entry_urls
     
     def start_batch(self):
         """Start the batch download process"""
@@ -148,7 +278,7 @@ class BatchDownloader:
             return
         
         self.is_running = True
-        self.logger.info(f"Starting batch download with {self.max_concurrent} concurrent downloads")
+        self.logger.info("Starting batch download with %s concurrent downloads", self.max_concurrent)
         
         # Start worker threads
         for i in range(self.max_concurrent):
@@ -160,6 +290,8 @@ class BatchDownloader:
             thread.start()
             self.worker_threads.append(thread)
         
+        self._start_dispatcher()
+        
         # Notify status callback
         if self.status_callback:
             self.status_callback('batch_started', None)
@@ -169,19 +301,25 @@ class BatchDownloader:
         self.is_running = False
         self.logger.info("Stopping batch download")
         
-        # Cancel active downloads
-        with self.queue_lock:
+        with self.queue_ready:
+            # Cancel active downloads
             for item in self.active_downloads.values():
                 item.status = DownloadStatus.CANCELLED
-        
-        # Clear queue
-        while not self.download_queue.empty():
-            try:
-                item = self.download_queue.get_nowait()
+                item.handle.cancel()
+            
+            # Clear queue and drop items not fed in yet
+            while self.download_queue:
+                item = self.download_queue.popleft()
                 item.status = DownloadStatus.CANCELLED
                 self.failed_downloads.append(item)
-            except Empty:
-                break
+                self.failed_count += 1
+            
+            self._feed_generation += 1
+            self._feed_backlog = 0
+            
+            # Wake idle workers and feeders so they see the batch stopped
+            self.queue_ready.notify_all()
+            self.queue_space.notify_all()
         
         # Wait for threads to finish
         for thread in self.worker_threads:
@@ -199,12 +337,15 @@ class BatchDownloader:
         self.is_running = False
         self.logger.info("Pausing batch download")
         
+        with self.queue_ready:
+            self.queue_ready.notify_all()
+        
         if self.status_callback:
             self.status_callback('batch_paused', None)
     
     def resume_batch(self):
         """Resume the batch download process"""
-        if not self.is_running and (not self.download_queue.empty() or self.active_downloads):
+        if not self.is_running and (self.download_queue or self._feed_backlog or self.active_downloads):
             self.start_batch()
     
     def remove_download(self, download_id: str) -> bool:
@@ -214,6 +355,7 @@ class BatchDownloader:
             if download_id in self.active_downloads:
                 item = self.active_downloads[download_id]
                 item.status = DownloadStatus.CANCELLED
+                item.handle.cancel()
                 return True
         
         # TODO: Remove from queue (requires queue modification)
@@ -223,10 +365,11 @@ class BatchDownloader:
         """Get current queue status"""
         with self.queue_lock:
             return {
-                'queue_size': self.download_queue.qsize(),
+                'queue_size': len(self.download_queue) + self._feed_backlog,
+                'backlog_size': self._feed_backlog,
                 'active_downloads': len(self.active_downloads),
-                'completed_downloads': len(self.completed_downloads),
-                'failed_downloads': len(self.failed_downloads),
+                'completed_downloads': self.completed_count,
+                'failed_downloads': self.failed_count,
                 'is_running': self.is_running,
                 'max_concurrent': self.max_concurrent
             }
@@ -234,45 +377,36 @@ class BatchDownloader:
     def get_all_downloads(self) -> Dict[str, List[DownloadItem]]:
         """Get all downloads organized by status"""
         with self.queue_lock:
-            # Get pending downloads from queue
-            pending = []
-            temp_queue = Queue()
-            
-            while not self.download_queue.empty():
-                try:
-                    item = self.download_queue.get_nowait()
-                    pending.append(item)
-                    temp_queue.put(item)
-                except Empty:
-                    break
-            
-            # Restore queue
-            while not temp_queue.empty():
-                self.download_queue.put(temp_queue.get_nowait())
-            
             return {
-                'pending': pending,
+                'pending': list(self.download_queue),
                 'active': list(self.active_downloads.values()),
-                'completed': self.completed_downloads.copy(),
-                'failed': self.failed_downloads.copy()
+                'completed': list(self.completed_downloads),
+                'failed': list(self.failed_downloads)
             }
     
     def _worker_thread(self):
         """Worker thread for processing downloads"""
         thread_name = threading.current_thread().name
-        self.logger.info(f"Worker thread {thread_name} started")
+        self.logger.info("Worker thread %s started", thread_name)
         
         while self.is_running:
             try:
-                # Get next download item
-                item = self.download_queue.get(timeout=1)
-                
-                # Add to active downloads
-                with self.queue_lock:
+                # Get next download item and mark it active
+                with self.queue_ready:
+                    self.queue_ready.wait_for(
+                        lambda: self.download_queue or not self.is_running,
+                        timeout=1
+                    )
+                    if not self.is_running or not self.download_queue:
+                        continue
+                    
+                    item = self.download_queue.popleft()
+                    self.queue_space.notify()
+                    item.handle = DownloadHandle()
                     self.active_downloads[item.id] = item
                     item.status = DownloadStatus.DOWNLOADING
                 
-                self.logger.info(f"[{thread_name}] Starting download: {item.url}")
+                self.logger.info("[%s] Starting download: %s", thread_name, item.url)
                 
                 # Notify status callback
                 if self.status_callback:
@@ -289,27 +423,61 @@ class BatchDownloader:
                     if success and item.status != DownloadStatus.CANCELLED:
                         item.status = DownloadStatus.COMPLETED
                         self.completed_downloads.append(item)
-                        self.logger.info(f"[{thread_name}] Download completed: {item.url}")
+                        self.completed_count += 1
+                        self.logger.info("[%s] Download completed: %s", thread_name, item.url)
                     else:
                         if item.status != DownloadStatus.CANCELLED:
                             item.status = DownloadStatus.FAILED
                         self.failed_downloads.append(item)
-                        self.logger.error(f"[{thread_name}] Download failed: {item.url}")
+                        self.failed_count += 1
+                        self.logger.error("[%s] Download failed: %s", thread_name, item.url)
                 
                 # Notify status callback
                 if self.status_callback:
                     self.status_callback('download_completed', item)
                 
-                # Mark task as done
-                self.download_queue.task_done()
-                
-            except Empty:
-                # No items in queue, continue
-                continue
             except Exception as e:
-                self.logger.error(f"Error in worker thread {thread_name}: {e}")
+                self.logger.error("Error in worker thread %s: %s", thread_name, e)
         
-        self.logger.info(f"Worker thread {thread_name} stopped")
+        self.logger.info("Worker thread %s stopped", thread_name)
+    
+    def _start_dispatcher(self):
+        """Start the progress dispatcher unless one is still alive"""
+        with self._progress_lock:
+            if self._dispatcher is not None:
+                return
+            self._dispatcher = threading.Thread(
+                target=self._dispatch_progress,
+                name="BatchProgress",
+                daemon=True
+            )
+            self._dispatcher.start()
+    
+    def _dispatch_progress(self):
+        """Deliver coalesced progress updates until no download is in flight"""
+        while True:
+            time.sleep(PROGRESS_FLUSH_INTERVAL)
+            self._flush_progress()
+            
+            # Paused downloads keep reporting until they finish
+            with self._progress_lock:
+                if not (self.is_running or self.active_downloads or self._pending_progress):
+                    self._dispatcher = None
+                    return
+    
+    def _flush_progress(self):
+        """Call the progress callback once for each item updated since the last flush"""
+        with self._progress_lock:
+            pending, self._pending_progress = self._pending_progress, {}
+        
+        if not self.progress_callback:
+            return
+        
+        for item, progress_info in pending.values():
+            try:
+                self.progress_callback(item, progress_info)
+            except Exception as e:
+                self.logger.error("Error in progress callback: %s", e)
     
     def _perform_download(self, item: DownloadItem) -> bool:
         """Perform the actual download"""
@@ -318,8 +486,9 @@ class BatchDownloader:
                 item.progress = progress_info.get('progress', 0)
                 item.filename = progress_info.get('filename', '')
                 
-                if self.progress_callback:
-                    self.progress_callback(item, progress_info)
+                # Only the newest update per item survives until the next flush
+                with self._progress_lock:
+                    self._pending_progress[item.id] = (item, progress_info)
             
             def completion_callback(success, message):
                 if not success:
@@ -332,7 +501,8 @@ class BatchDownloader:
                     quality=item.quality,
                     format_ext=item.format_ext,
                     progress_callback=progress_callback,
-                    completion_callback=completion_callback
+                    completion_callback=completion_callback,
+                    handle=item.handle
                 )
             elif item.download_type == DownloadType.AUDIO:
                 return self.audio_downloader.download_audio(
@@ -342,12 +512,13 @@ class BatchDownloader:
                     format_ext=item.format_ext,
                     add_metadata=item.add_metadata,
                     progress_callback=progress_callback,
-                    completion_callback=completion_callback
+                    completion_callback=completion_callback,
+                    handle=item.handle
                 )
             
             return False
             
         except Exception as e:
             item.error_message = str(e)
-            self.logger.error(f"Error downloading {item.url}: {e}")
+            self.logger.error("Error downloading %s: %s", item.url, e)
             return False
@@ -0,0 +1,22 @@
+"""
+Download handle module for YTDL application
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+@dataclass
+class DownloadHandle:
+    """Per-download state, so concurrent downloads on one downloader don't share flags"""
+    cancelled: threading.Event = field(default_factory=threading.Event)
+    ydl: Optional[Any] = None
+
+    def cancel(self):
+        """Request cancellation, checked by the yt-dlp hooks"""
+        self.cancelled.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Check if cancellation was requested"""
+        return self.cancelled.is_set()
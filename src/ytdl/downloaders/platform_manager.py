@@ -3,16 +3,132 @@ Platform-specific download manager for YTDL application
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 from ..utils.logger import get_logger
 
+# HTTP(S) scheme prefix, in any letter case
+_SCHEME_RE = re.compile(r'https?://', re.IGNORECASE)
+
 class PlatformManager:
     """Manages platform-specific download configurations"""
     
+    # Category shown for each platform, anything missing is 'other'
+    _CATEGORY_MAPPING = {
+        'youtube': 'video',
+        'vimeo': 'video',
+        'dailymotion': 'video',
+        'instagram': 'social',
+        'tiktok': 'social',
+        'facebook': 'social',
+        'twitter': 'social',
+        'twitch': 'streaming',
+        'kick': 'streaming',
+        'rumble': 'video',
+        'soundcloud': 'audio',
+        'bandcamp': 'audio',
+        'mixcloud': 'audio',
+        'ted': 'educational',
+        'coursera': 'educational',
+        'pornhub': 'adult',
+        'xvideos': 'adult',
+        'xhamster': 'adult',
+        'bilibili': 'video',
+        'niconico': 'video',
+    }
+    
+    # Video qualities offered, best first
+    _ALL_QUALITIES = ('4320p', '2160p', '1440p', '1080p', '720p', '480p', '360p', '240p')
+    
     def __init__(self):
         self.logger = get_logger()
         self.platforms = self._define_platforms()
+        self._compile_patterns()
+        self._domain_map = self._build_domain_map()
+        self._url_pattern, self._pattern_groups = self._build_url_pattern()
+        self._generic_result = ('generic', self.platforms['generic'])
+        self._precompute_options()
+        self._categories = self._build_categories()
+        self._supported_cache = {
+            (include_adult, include_generic): self._build_supported_platforms(include_adult, include_generic)
+            for include_adult in (True, False)
+            for include_generic in (True, False)
+        }
+        self._supported_platforms_msg = ', '.join(self.get_supported_platforms())
+        
+        # Platforms don't change after construction, so results can be memoized per instance
+        self._identify_cached = lru_cache(maxsize=4096)(self._identify_platform)
+        self._validate_cached = lru_cache(maxsize=4096)(self._validate_url)
+    
+    def _compile_patterns(self):
+        """Compile each platform's URL patterns once, keeping the source strings"""
+        for info in self.platforms.values():
+            info['pattern_sources'] = info['patterns']
+            info['patterns'] = [re.compile(pattern, re.IGNORECASE) for pattern in info['patterns']]
+    
+    def _precompute_options(self):
+        """Build each platform's static capabilities and download options once"""
+        for platform_id, info in self.platforms.items():
+            info['_quality_options'] = self._get_quality_options(info['max_quality'])
+            info['_capabilities'] = {
+                'platform': info['name'],
+                'supports': info['supports'],
+                'max_quality': info['max_quality'],
+                'formats': info['formats']
+            }
+            
+            options = {
+                'qualities': info['_quality_options'],
+                'formats': info['formats'],
+                'supports_subtitles': 'subtitles' in info['supports'],
+                'supports_playlist': 'playlist' in info['supports'],
+                'recommended_format': 'mp4',
+                'recommended_quality': '720p'
+            }
+            
+            # Platform-specific recommendations
+            if platform_id == 'youtube':
+                options['recommended_quality'] = '1080p'
+            elif platform_id in ['instagram', 'tiktok']:
+                options['recommended_quality'] = '720p'
+            elif platform_id == 'twitter':
+                options['recommended_quality'] = '480p'
+            
+            info['_download_options'] = options
+    
+    def _build_domain_map(self) -> Dict[str, Tuple[str, Dict]]:
+        """Map every registered domain to its (platform ID, platform info) result"""
+        domain_map = {}
+        for platform_id, info in self.platforms.items():
+            for domain in info['domains']:
+                domain_map.setdefault(domain, (platform_id, info))
+        return domain_map
+    
+    def _build_url_pattern(self) -> Tuple[Optional[re.Pattern], Dict[str, Tuple[str, Dict]]]:
+        """Combine the URL patterns the domain map can't cover into one alternation
+        
+        Patterns that spell out one of their platform's domains are left out,
+        a URL on that domain is already caught by the domain lookup. Each
+        remaining pattern gets its own named group, the returned dict maps the
+        group name back to its (platform ID, platform info) result.
+        """
+        alternatives = []
+        pattern_groups = {}
+        for platform_id, info in self.platforms.items():
+            if info.get('fallback'):
+                continue
+            escaped_domains = [re.escape(domain) for domain in info['domains']]
+            for index, pattern in enumerate(info['pattern_sources']):
+                if any(domain in pattern for domain in escaped_domains):
+                    continue
+                group = f'{platform_id}_{index}'
+                alternatives.append(f'(?P<{group}>{pattern})')
+                pattern_groups[group] = (platform_id, info)
+        
+        if not alternatives:
+            return None, pattern_groups
+        return re.compile('|'.join(alternatives), re.IGNORECASE), pattern_groups
     
     def _define_platforms(self) -> Dict[str, Dict]:
         """Define supported platforms and their configurations"""
@@ -84,7 +200,7 @@ class PlatformManager:
                 'name': 'Twitter/X',
                 'domains': ['twitter.com', 'x.com'],
                 'patterns': [
-                    r'(?:twitter|x)\.com/[^/]+/status/(\d+)'
+                    r'(?:twitter\.com|x\.com)/[^/]+/status/(\d+)'
                 ],
                 'supports': ['video', 'audio'],
                 'max_quality': '1080p',
@@ -219,33 +335,39 @@ class PlatformManager:
     
     def identify_platform(self, url: str) -> Optional[Tuple[str, Dict]]:
         """Identify platform from URL"""
+        if not isinstance(url, str):
+            return None
+        return self._identify_cached(url)
+    
+    def _identify_platform(self, url: str) -> Optional[Tuple[str, Dict]]:
+        """Identify platform from URL without the cache"""
+        # Only the host is lowercased, patterns match case-insensitively
         try:
-            parsed_url = urlparse(url.lower())
-            domain = parsed_url.netloc.replace('www.', '')
-
-            # First pass: exact matches (excluding generic)
-            for platform_id, platform_info in self.platforms.items():
-                if platform_info.get('fallback'):
-                    continue
-
-                # Check domain match
-                if platform_info['domains'] and any(domain.endswith(d) for d in platform_info['domains']):
-                    return platform_id, platform_info
+            domain = urlparse(url).hostname or ''
+        except ValueError as e:
+            # Malformed netloc, e.g. an unclosed IPv6 bracket
+            self.logger.error("Error identifying platform: %s", e)
+            return None
+        if domain.startswith('www.'):
+            domain = domain[4:]
 
-                # Check pattern match
-                for pattern in platform_info['patterns']:
-                    if re.search(pattern, url, re.IGNORECASE):
-                        return platform_id, platform_info
+        # First pass: the domain or one of its parent domains is registered
+        parts = domain.split('.')
+        for i in range(len(parts)):
+            result = self._domain_map.get('.'.join(parts[i:]))
+            if result:
+                return result
 
-            # Second pass: try generic fallback for any HTTP(S) URL
-            if url.startswith(('http://', 'https://')):
-                return 'generic', self.platforms['generic']
+        # Second pass: patterns not tied to a domain (excluding generic), in a single regex search
+        match = self._url_pattern.search(url) if self._url_pattern else None
+        if match:
+            return self._pattern_groups[match.lastgroup]
 
-            return None
+        # Last pass: try generic fallback for any HTTP(S) URL
+        if _SCHEME_RE.match(url):
+            return self._generic_result
 
-        except Exception as e:
-            self.logger.error(f"Error identifying platform: {e}")
-            return None
+        return None
     
     def get_platform_info(self, platform_id: str) -> Optional[Dict]:
         """Get platform information"""
@@ -253,6 +375,10 @@ class PlatformManager:
     
     def get_supported_platforms(self, include_adult: bool = True, include_generic: bool = False) -> List[str]:
         """Get list of supported platform names"""
+        return list(self._supported_cache[(bool(include_adult), bool(include_generic))])
+    
+    def _build_supported_platforms(self, include_adult: bool, include_generic: bool) -> Tuple[str, ...]:
+        """List supported platform names for one combination of filters"""
         platforms = []
         for platform_id, info in self.platforms.items():
             if not include_adult and info.get('category') == 'adult':
@@ -260,10 +386,14 @@ class PlatformManager:
             if not include_generic and info.get('fallback'):
                 continue
             platforms.append(info['name'])
-        return platforms
+        return tuple(platforms)
 
     def get_platform_categories(self) -> Dict[str, List[str]]:
         """Get platforms organized by category"""
+        return {category: names.copy() for category, names in self._categories.items()}
+    
+    def _build_categories(self) -> Dict[str, List[str]]:
+        """Group platform names by category"""
         categories = {
             'video': [],
             'audio': [],
@@ -274,60 +404,40 @@ class PlatformManager:
             'other': []
         }
 
-        category_mapping = {
-            'youtube': 'video',
-            'vimeo': 'video',
-            'dailymotion': 'video',
-            'instagram': 'social',
-            'tiktok': 'social',
-            'facebook': 'social',
-            'twitter': 'social',
-            'twitch': 'streaming',
-            'kick': 'streaming',
-            'rumble': 'video',
-            'soundcloud': 'audio',
-            'bandcamp': 'audio',
-            'mixcloud': 'audio',
-            'ted': 'educational',
-            'coursera': 'educational',
-            'pornhub': 'adult',
-            'xvideos': 'adult',
-            'xhamster': 'adult',
-            'bilibili': 'video',
-            'niconico': 'video',
-        }
-
         for platform_id, info in self.platforms.items():
             if info.get('fallback'):
                 continue
-            category = category_mapping.get(platform_id, 'other')
+            category = self._CATEGORY_MAPPING.get(platform_id, 'other')
             categories[category].append(info['name'])
 
         return categories
 
-    def is_adult_content(self, url: str) -> bool:
-        """Check if URL is from an adult content platform"""
-        platform_info = self.identify_platform(url)
+    def is_adult_content(self, url: str, platform_info: Optional[Tuple[str, Dict]] = None) -> bool:
+        """Check if URL is from an adult content platform
+        
+        Like the other URL helpers below, this accepts the result of an
+        earlier identify_platform call to skip identifying the URL again.
+        """
+        platform_info = platform_info or self.identify_platform(url)
         if platform_info:
             platform_id, info = platform_info
             return info.get('category') == 'adult'
         return False
     
-    def is_url_supported(self, url: str) -> bool:
+    def is_url_supported(self, url: str, platform_info: Optional[Tuple[str, Dict]] = None) -> bool:
         """Check if URL is from a supported platform"""
-        return self.identify_platform(url) is not None
+        return (platform_info or self.identify_platform(url)) is not None
     
-    def get_platform_capabilities(self, url: str) -> Optional[Dict]:
+    def get_platform_capabilities(
+        self,
+        url: str,
+        platform_info: Optional[Tuple[str, Dict]] = None
+    ) -> Optional[Dict]:
         """Get capabilities for the platform of the given URL"""
-        platform_info = self.identify_platform(url)
+        platform_info = platform_info or self.identify_platform(url)
         if platform_info:
             platform_id, info = platform_info
-            return {
-                'platform': info['name'],
-                'supports': info['supports'],
-                'max_quality': info['max_quality'],
-                'formats': info['formats']
-            }
+            return info['_capabilities'].copy()
         return None
     
     def validate_url(self, url: str) -> Tuple[bool, str]:
@@ -335,10 +445,12 @@ class PlatformManager:
         if not url or not url.strip():
             return False, "URL cannot be empty"
         
-        url = url.strip()
-        
+        return self._validate_cached(url.strip())
+    
+    def _validate_url(self, url: str) -> Tuple[bool, str]:
+        """Validate a stripped, non-empty URL without the cache"""
         # Basic URL validation
-        if not url.startswith(('http://', 'https://')):
+        if not _SCHEME_RE.match(url):
             url = 'https://' + url
         
         try:
@@ -351,44 +463,27 @@ class PlatformManager:
         # Check if platform is supported
         platform_info = self.identify_platform(url)
         if not platform_info:
-            return False, f"Platform not supported. Supported platforms: {', '.join(self.get_supported_platforms())}"
+            return False, f"Platform not supported. Supported platforms: {self._supported_platforms_msg}"
         
         return True, f"Valid {platform_info[1]['name']} URL"
     
-    def get_download_options(self, url: str) -> Dict:
+    def get_download_options(self, url: str, platform_info: Optional[Tuple[str, Dict]] = None) -> Dict:
         """Get recommended download options for platform"""
-        platform_info = self.identify_platform(url)
+        platform_info = platform_info or self.identify_platform(url)
         if not platform_info:
             return self._get_default_options()
         
         platform_id, info = platform_info
-        
-        # Platform-specific optimizations
-        options = {
-            'qualities': self._get_quality_options(info['max_quality']),
-            'formats': info['formats'],
-            'supports_subtitles': 'subtitles' in info['supports'],
-            'supports_playlist': 'playlist' in info['supports'],
-            'recommended_format': 'mp4',
-            'recommended_quality': '720p'
-        }
-        
-        # Platform-specific recommendations
-        if platform_id == 'youtube':
-            options['recommended_quality'] = '1080p'
-        elif platform_id in ['instagram', 'tiktok']:
-            options['recommended_quality'] = '720p'
-        elif platform_id == 'twitter':
-            options['recommended_quality'] = '480p'
-        
-        return options
+        return info['_download_options'].copy()
     
     def _get_quality_options(self, max_quality: str) -> List[str]:
         """Get available quality options based on max quality"""
-        all_qualities = ['4320p', '2160p', '1440p', '1080p', '720p', '480p', '360p', '240p']
+        if not max_quality[:-1].isdigit():
+            # Audio-only platforms have no video quality ('N/A')
+            return ['Best', 'Audio Only']
         max_height = int(max_quality.replace('p', ''))
         
-        return ['Best'] + [q for q in all_qualities if int(q.replace('p', '')) <= max_height] + ['Audio Only']
+        return ['Best'] + [q for q in self._ALL_QUALITIES if int(q.replace('p', '')) <= max_height] + ['Audio Only']
     
     def _get_default_options(self) -> Dict:
         """Get default download options for unknown platforms"""
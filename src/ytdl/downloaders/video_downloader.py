@@ -4,14 +4,28 @@ Video downloader module for YTDL application
 
 import yt_dlp
 import os
+import re
 import threading
 import time
 import signal
 import subprocess
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any, Callable, Optional, List
 from ..utils.config import Config
 from ..utils.logger import get_logger
+from .download_handle import DownloadHandle
+
+# Progress updates closer together than this (seconds, fraction) are dropped
+PROGRESS_INTERVAL = 0.1
+PROGRESS_STEP = 0.01
+
+# Leading number in a quality label, e.g. '1080' in '1080p60'
+_QUALITY_HEIGHT = re.compile(r'\d+')
+
+# Output formats handled by each ffmpeg post-processor
+_VIDEO_CONVERT_FORMATS = frozenset({'mp4', 'mkv', 'avi'})
+_AUDIO_EXTRACT_FORMATS = frozenset({'wav', 'flac', 'm4a', 'ogg'})
 
 class VideoDownloader:
     """Video downloader using yt-dlp"""
@@ -20,34 +34,38 @@ class VideoDownloader:
         self.config = config
         self.logger = get_logger()
         self.current_download = None
-        self.download_cancelled = False
-        self.ydl_process = None
-        self.download_lock = threading.Lock()
+        self.current_handle: Optional[DownloadHandle] = None
+        self._local = threading.local()
         
+    def _info_ydl(self) -> yt_dlp.YoutubeDL:
+        """Get this thread's YoutubeDL for metadata lookups, creating it on first use"""
+        ydl = getattr(self._local, 'info_ydl', None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL({
+                'quiet': True,
+                'no_warnings': True,
+            })
+            self._local.info_ydl = ydl
+        return ydl
+    
     def get_video_info(self, url: str) -> Dict[str, Any]:
         """Get video information without downloading"""
         try:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-            }
+            info = self._info_ydl().extract_info(url, download=False)
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                
-                return {
-                    'title': info.get('title', 'Unknown'),
-                    'uploader': info.get('uploader', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'view_count': info.get('view_count', 0),
-                    'formats': self._extract_formats(info.get('formats', [])),
-                    'thumbnail': info.get('thumbnail'),
-                    'description': info.get('description', ''),
-                    'upload_date': info.get('upload_date'),
-                }
+            return {
+                'title': info.get('title', 'Unknown'),
+                'uploader': info.get('uploader', 'Unknown'),
+                'duration': info.get('duration', 0),
+                'view_count': info.get('view_count', 0),
+                'formats': self._extract_formats(info.get('formats', [])),
+                'thumbnail': info.get('thumbnail'),
+                'description': info.get('description', ''),
+                'upload_date': info.get('upload_date'),
+            }
                 
         except Exception as e:
-            self.logger.error(f"Error getting video info: {e}")
+            self.logger.error("Error getting video info: %s", e)
             raise Exception(f"Failed to get video information: {str(e)}")
     
     def _extract_formats(self, formats: List[Dict]) -> List[Dict[str, Any]]:
@@ -56,39 +74,33 @@ class VideoDownloader:
         audio_formats = []
         
         for fmt in formats:
-            if fmt.get('vcodec') != 'none' and fmt.get('acodec') != 'none':
-                # Video with audio
-                video_formats.append({
-                    'format_id': fmt.get('format_id'),
-                    'ext': fmt.get('ext'),
-                    'quality': fmt.get('height', 0),
-                    'fps': fmt.get('fps'),
-                    'filesize': fmt.get('filesize'),
-                    'type': 'video+audio'
-                })
-            elif fmt.get('vcodec') != 'none':
-                # Video only
+            get = fmt.get
+            has_video = get('vcodec') != 'none'
+            has_audio = get('acodec') != 'none'
+            
+            if has_video:
+                # Video with or without audio
                 video_formats.append({
-                    'format_id': fmt.get('format_id'),
-                    'ext': fmt.get('ext'),
-                    'quality': fmt.get('height', 0),
-                    'fps': fmt.get('fps'),
-                    'filesize': fmt.get('filesize'),
-                    'type': 'video'
+                    'format_id': get('format_id'),
+                    'ext': get('ext'),
+                    'quality': get('height') or 0,
+                    'fps': get('fps'),
+                    'filesize': get('filesize'),
+                    'type': 'video+audio' if has_audio else 'video'
                 })
-            elif fmt.get('acodec') != 'none':
+            elif has_audio:
                 # Audio only
                 audio_formats.append({
-                    'format_id': fmt.get('format_id'),
-                    'ext': fmt.get('ext'),
-                    'abr': fmt.get('abr'),
-                    'filesize': fmt.get('filesize'),
+                    'format_id': get('format_id'),
+                    'ext': get('ext'),
+                    'abr': get('abr') or 0,
+                    'filesize': get('filesize'),
                     'type': 'audio'
                 })
         
         return {
-            'video': sorted(video_formats, key=lambda x: x.get('quality', 0), reverse=True),
-            'audio': sorted(audio_formats, key=lambda x: x.get('abr', 0), reverse=True)
+            'video': sorted(video_formats, key=itemgetter('quality'), reverse=True),
+            'audio': sorted(audio_formats, key=itemgetter('abr'), reverse=True)
         }
     
     def download_video(
@@ -98,47 +110,71 @@ class VideoDownloader:
         quality: str = 'best',
         format_ext: str = 'mp4',
         progress_callback: Optional[Callable] = None,
-        completion_callback: Optional[Callable] = None
+        completion_callback: Optional[Callable] = None,
+        handle: Optional[DownloadHandle] = None
     ) -> bool:
-        """Download video with specified options"""
+        """Download video with specified options
+        
+        Pass a handle to be able to cancel this particular download.
+        """
+
+        if handle is None:
+            handle = DownloadHandle()
+        # Bound once, the hooks below check it on every chunk
+        is_cancelled = handle.cancelled.is_set
+
+        # Last emitted (time, progress), smaller updates are dropped
+        last_emit = [0.0, -1.0]
 
         def progress_hook(d):
             # Check for cancellation
-            if self.download_cancelled:
+            if is_cancelled():
                 raise yt_dlp.DownloadError("Download cancelled by user")
 
-            if progress_callback and d['status'] == 'downloading':
-                try:
-                    if 'total_bytes' in d:
-                        progress = d['downloaded_bytes'] / d['total_bytes']
-                    elif 'total_bytes_estimate' in d:
-                        progress = d['downloaded_bytes'] / d['total_bytes_estimate']
-                    else:
-                        progress = 0
-
-                    progress_callback({
-                        'progress': progress,
-                        'downloaded': d.get('downloaded_bytes', 0),
-                        'total': d.get('total_bytes', d.get('total_bytes_estimate', 0)),
-                        'speed': d.get('speed', 0),
-                        'eta': d.get('eta', 0),
-                        'filename': d.get('filename', ''),
-                        'status': d.get('status', 'downloading')
-                    })
-                except Exception as e:
-                    self.logger.error(f"Error in progress callback: {e}")
+            if progress_callback is None or d['status'] != 'downloading':
+                return
 
-        try:
-            with self.download_lock:
-                self.download_cancelled = False
+            downloaded = d.get('downloaded_bytes') or 0
+            total = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
+            progress = downloaded / total if total else 0.0
+
+            now = time.monotonic()
+            # The final chunk always goes through so the UI can reach 100%
+            if (progress < 1.0
+                    and now - last_emit[0] < PROGRESS_INTERVAL
+                    and abs(progress - last_emit[1]) < PROGRESS_STEP):
+                return
+            last_emit[0] = now
+            last_emit[1] = progress
+
+            try:
+                progress_callback({
+                    'progress': progress,
+                    'downloaded': downloaded,
+                    'total': total,
+                    'speed': d.get('speed', 0),
+                    'eta': d.get('eta', 0),
+                    'filename': d.get('filename', ''),
+                    'status': 'downloading'
+                })
+            except Exception as e:
+                self.logger.error("Error in progress callback: %s", e)
 
+        def postprocessor_hook(d):
+            # Stop before the next conversion step once cancelled
+            if is_cancelled():
+                raise yt_dlp.DownloadError("Download cancelled by user")
+
+        try:
             # Ensure output directory exists
             Path(output_path).mkdir(parents=True, exist_ok=True)
+            format_ext = format_ext.lower()
 
             # Configure yt-dlp options
             ydl_opts = {
                 'outtmpl': os.path.join(output_path, '%(title)s.%(ext)s'),
                 'progress_hooks': [progress_hook],
+                'postprocessor_hooks': [postprocessor_hook],
                 'format': self._get_format_selector(quality, format_ext),
                 'writesubtitles': self.config.get('download_subtitles', False),
                 'writeautomaticsub': self.config.get('download_auto_subtitles', False),
@@ -148,29 +184,29 @@ class VideoDownloader:
             }
 
             # Add post-processor for format conversion if needed
-            if format_ext.lower() in ['mp4', 'mkv', 'avi']:
+            if format_ext in _VIDEO_CONVERT_FORMATS:
                 ydl_opts['postprocessors'] = [{
                     'key': 'FFmpegVideoConvertor',
-                    'preferedformat': format_ext.lower(),
+                    'preferedformat': format_ext,
                 }]
-            elif format_ext.lower() == 'mp3':
+            elif format_ext == 'mp3':
                 ydl_opts['postprocessors'] = [{
                     'key': 'FFmpegExtractAudio',
                     'preferredcodec': 'mp3',
                     'preferredquality': self.config.get('audio_quality', '192'),
                 }]
-            elif format_ext.lower() in ['wav', 'flac', 'm4a', 'ogg']:
+            elif format_ext in _AUDIO_EXTRACT_FORMATS:
                 ydl_opts['postprocessors'] = [{
                     'key': 'FFmpegExtractAudio',
-                    'preferredcodec': format_ext.lower(),
+                    'preferredcodec': format_ext,
                 }]
 
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                self.ydl_process = ydl
+                handle.ydl = ydl
                 ydl.download([url])
 
             # Check if cancelled during download
-            if self.download_cancelled:
+            if handle.is_cancelled:
                 if completion_callback:
                     completion_callback(False, "Download cancelled by user")
                 return False
@@ -203,24 +239,21 @@ class VideoDownloader:
             return False
 
         finally:
-            self.ydl_process = None
+            handle.ydl = None
     
     def _get_format_selector(self, quality: str, format_ext: str) -> str:
         """Get yt-dlp format selector string"""
-        if quality.lower() == 'best':
-            if format_ext.lower() == 'mp3':
-                return 'bestaudio/best'
-            return 'best'
-        elif quality.lower() == 'audio only':
+        quality = quality.lower()
+        if format_ext.lower() == 'mp3' or quality == 'audio only':
             return 'bestaudio/best'
-        else:
-            # Extract height from quality (e.g., '1080p' -> '1080')
-            height = ''.join(filter(str.isdigit, quality))
-            if height:
-                if format_ext.lower() == 'mp3':
-                    return 'bestaudio/best'
-                return f'best[height<={height}]'
+        if quality == 'best':
             return 'best'
+        
+        # Extract height from quality (e.g., '1080p' -> '1080')
+        height = _QUALITY_HEIGHT.search(quality)
+        if height:
+            return f'best[height<={height.group(0)}]'
+        return 'best'
     
     def download_video_async(
         self,
@@ -233,34 +266,32 @@ class VideoDownloader:
     ) -> threading.Thread:
         """Download video asynchronously"""
         
+        handle = DownloadHandle()
+        
         def download_thread():
             self.download_video(
                 url, output_path, quality, format_ext,
-                progress_callback, completion_callback
+                progress_callback, completion_callback, handle
             )
         
         thread = threading.Thread(target=download_thread, daemon=True)
+        self.current_handle = handle
         thread.start()
         self.current_download = thread
         
         return thread
     
-    def cancel_download(self):
-        """Cancel current download"""
+    def cancel_download(self, handle: Optional[DownloadHandle] = None):
+        """Cancel a download, the one started by download_video_async by default"""
         try:
-            with self.download_lock:
-                self.download_cancelled = True
+            handle = handle or self.current_handle
+            if handle is None:
+                return False
 
+            # The yt-dlp hooks raise once they see the cancelled flag
+            handle.cancel()
             self.logger.info("Download cancellation requested")
 
-            # If there's an active yt-dlp process, try to interrupt it
-            if self.ydl_process:
-                try:
-                    # This will cause the progress hook to raise an exception
-                    self.logger.info("Interrupting yt-dlp process")
-                except Exception as e:
-                    self.logger.error(f"Error interrupting yt-dlp: {e}")
-
             # If there's a download thread, it will check the cancelled flag
             if self.current_download and self.current_download.is_alive():
                 self.logger.info("Waiting for download thread to stop...")
@@ -269,19 +300,19 @@ class VideoDownloader:
             return True
 
         except Exception as e:
-            self.logger.error(f"Error cancelling download: {e}")
+            self.logger.error("Error cancelling download: %s", e)
             return False
 
     def is_download_active(self) -> bool:
         """Check if a download is currently active"""
         return (self.current_download and
                 self.current_download.is_alive() and
-                not self.download_cancelled)
+                not (self.current_handle and self.current_handle.is_cancelled))
 
     def get_download_status(self) -> Dict[str, Any]:
         """Get current download status"""
         return {
             'active': self.is_download_active(),
-            'cancelled': self.download_cancelled,
+            'cancelled': bool(self.current_handle and self.current_handle.is_cancelled),
             'thread_alive': self.current_download.is_alive() if self.current_download else False
         }
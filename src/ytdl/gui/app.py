@@ -6,12 +6,25 @@ Clean, minimal, and well-commented implementation
 import flet as ft
 from ..utils.config import Config
 from ..utils.logger import get_logger
+from ..downloaders.platform_manager import PlatformManager
 from .pages.video_page import VideoPage
 from .pages.audio_page import AudioPage
 from .pages.batch_page import BatchPage
 from .pages.converter_page import ConverterPage
 from .pages.settings_page import SettingsPage
 
+# Page names in navigation rail order
+_PAGE_ORDER = ("video", "audio", "batch", "converter", "settings")
+
+# Navigation rail (icon, label) entries, in _PAGE_ORDER order
+_NAV_ITEMS = (
+    (ft.Icons.VIDEO_LIBRARY, "Video"),
+    (ft.Icons.AUDIOTRACK, "Audio"),
+    (ft.Icons.QUEUE, "Batch"),
+    (ft.Icons.TRANSFORM, "Convert"),
+    (ft.Icons.SETTINGS, "Settings"),
+)
+
 class YTDLApp:
     """Main YTDL Application using Flet"""
     
@@ -23,14 +36,43 @@ class YTDLApp:
         # Current page reference
         self.current_page = None
         
-        # Initialize pages
-        self.pages = {
-            "video": VideoPage(self.config),
-            "audio": AudioPage(self.config),
-            "batch": BatchPage(self.config),
-            "converter": ConverterPage(self.config),
-            "settings": SettingsPage(self.config, self.on_theme_change)
+        # One platform registry for every page that validates URLs
+        self.platform_manager = PlatformManager()
+        
+        # Pages are created on first navigation, only the video page is needed at startup
+        self._page_factories = {
+            "video": lambda: VideoPage(self.config, self.platform_manager),
+            "audio": lambda: AudioPage(self.config, self.platform_manager),
+            "batch": lambda: BatchPage(self.config),
+            "converter": lambda: ConverterPage(self.config),
+            "settings": lambda: SettingsPage(self.config, self.on_theme_change)
         }
+        self._pages = {}
+        
+        # Built control trees, reused so switching tabs keeps entered URLs and progress
+        self._built = {}
+        
+        # Theme mode currently applied, and the kawaii theme built once
+        self._current_theme_mode = None
+        self._kawaii_theme = ft.Theme(color_scheme_seed=ft.Colors.PINK)
+        
+        # Navigation rail entries, owned by this app's page only
+        self._nav_destinations = [
+            ft.NavigationRailDestination(icon=icon, selected_icon=icon, label=label)
+            for icon, label in _NAV_ITEMS
+        ]
+        
+    def _get_page(self, name: str):
+        """Get a page object, creating it on first use"""
+        if name not in self._pages:
+            self._pages[name] = self._page_factories[name]()
+        return self._pages[name]
+    
+    def _get_content(self, name: str) -> ft.Control:
+        """Get a page's control tree, building it on first use"""
+        if name not in self._built:
+            self._built[name] = self._get_page(name).build()
+        return self._built[name]
         
     def build(self):
         """Build the application UI"""
@@ -51,39 +93,13 @@ class YTDLApp:
             label_type=ft.NavigationRailLabelType.ALL,
             min_width=100,
             min_extended_width=200,
-            destinations=[
-                ft.NavigationRailDestination(
-                    icon=ft.Icons.VIDEO_LIBRARY,
-                    selected_icon=ft.Icons.VIDEO_LIBRARY,
-                    label="Video"
-                ),
-                ft.NavigationRailDestination(
-                    icon=ft.Icons.AUDIOTRACK,
-                    selected_icon=ft.Icons.AUDIOTRACK,
-                    label="Audio"
-                ),
-                ft.NavigationRailDestination(
-                    icon=ft.Icons.QUEUE,
-                    selected_icon=ft.Icons.QUEUE,
-                    label="Batch"
-                ),
-                ft.NavigationRailDestination(
-                    icon=ft.Icons.TRANSFORM,
-                    selected_icon=ft.Icons.TRANSFORM,
-                    label="Convert"
-                ),
-                ft.NavigationRailDestination(
-                    icon=ft.Icons.SETTINGS,
-                    selected_icon=ft.Icons.SETTINGS,
-                    label="Settings"
-                ),
-            ],
+            destinations=self._nav_destinations,
             on_change=self.on_nav_change,
         )
         
         # Create main content area
         self.content_area = ft.Container(
-            content=self.pages["video"].build(),
+            content=self._get_content("video"),
             expand=True,
             padding=20
         )
@@ -108,28 +124,30 @@ class YTDLApp:
     def on_nav_change(self, e):
         """Handle navigation change"""
         # Map index to page name
-        page_names = ["video", "audio", "batch", "converter", "settings"]
-        selected_page = page_names[e.control.selected_index]
+        selected_page = _PAGE_ORDER[e.control.selected_index]
         
         if selected_page != self.current_page:
             # Update content area
-            self.content_area.content = self.pages[selected_page].build()
+            self.content_area.content = self._get_content(selected_page)
             self.current_page = selected_page
             
             # Update page
             self.page.update()
             
-            self.logger.info(f"Switched to {selected_page} page")
+            self.logger.info("Switched to %s page", selected_page)
     
     def on_theme_change(self, theme_mode: str):
         """Handle theme change from settings"""
         self.config.set('theme_mode', theme_mode)
-        self.apply_theme()
-        self.page.update()
+        if self.apply_theme():
+            self.page.update()
         
-    def apply_theme(self):
-        """Apply theme to the page"""
+    def apply_theme(self) -> bool:
+        """Apply theme to the page, returns False if it was already applied"""
         theme_mode = self.config.get('theme_mode', 'dark')
+        if theme_mode == self._current_theme_mode:
+            return False
+        self._current_theme_mode = theme_mode
         
         if theme_mode == 'dark':
             self.page.theme_mode = ft.ThemeMode.DARK
@@ -138,6 +156,6 @@ class YTDLApp:
         else:  # kawaii
             self.page.theme_mode = ft.ThemeMode.LIGHT
             # Custom kawaii colors
-            self.page.theme = ft.Theme(
-                color_scheme_seed=ft.Colors.PINK
-            )
+            self.page.theme = self._kawaii_theme
+        
+        return True
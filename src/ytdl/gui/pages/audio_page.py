@@ -2,20 +2,41 @@
 Audio Download Page - Clean and minimal Flet implementation
 """
 
+import asyncio
+import time
 import flet as ft
+from typing import Optional, TYPE_CHECKING
 from ...utils.config import Config
 from ...utils.logger import get_logger
-from ...downloaders.audio_downloader import AudioDownloader
 from ...downloaders.platform_manager import PlatformManager
+from ..updates import batch_updates
+
+if TYPE_CHECKING:
+    from ...downloaders.audio_downloader import AudioDownloader
+
+# Progress redraws closer together than this (seconds, fraction) are skipped
+PROGRESS_INTERVAL = 0.1
+PROGRESS_STEP = 0.01
+
+# URL validation waits until typing pauses for this long (seconds)
+VALIDATION_DELAY = 0.25
+
+# Bytes to megabytes, as a multiplier
+_INV_MB = 1.0 / (1024 * 1024)
+
+# Dropdown choices, each page builds its own Option controls from these
+_QUALITY_CHOICES = ("320", "256", "192", "128", "96")
+_FORMAT_CHOICES = ("MP3", "WAV", "FLAC", "M4A", "OGG")
 
 class AudioPage:
     """Audio download page with clean UI"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, platform_manager: Optional[PlatformManager] = None):
         self.config = config
         self.logger = get_logger()
-        self.downloader = AudioDownloader(config)
-        self.platform_manager = PlatformManager()
+        self._downloader = None
+        # Shared with the other pages when the app passes one in
+        self.platform_manager = platform_manager or PlatformManager()
         
         # UI components
         self.url_field = None
@@ -28,9 +49,27 @@ class AudioPage:
         self.progress_bar = None
         self.progress_text = None
         
+        self._snack = None
+        
         # Download state
         self.current_download = None
+        self._last_progress = -1.0
+        self._last_progress_ts = 0.0
         
+        # URL validation state, the last result is reused for an unchanged URL
+        self._last_url = None
+        self._last_validation = None
+        self._validate_task = None
+        
+    @property
+    def downloader(self) -> "AudioDownloader":
+        """Audio downloader, created on first download"""
+        if self._downloader is None:
+            # Imported here so yt-dlp only loads once a download starts
+            from ...downloaders.audio_downloader import AudioDownloader
+            self._downloader = AudioDownloader(self.config)
+        return self._downloader
+    
     def build(self) -> ft.Control:
         """Build the audio page UI"""
         
@@ -52,26 +91,14 @@ class AudioPage:
         self.quality_dropdown = ft.Dropdown(
             label="Quality",
             value="192",
-            options=[
-                ft.dropdown.Option("320"),
-                ft.dropdown.Option("256"),
-                ft.dropdown.Option("192"),
-                ft.dropdown.Option("128"),
-                ft.dropdown.Option("96"),
-            ],
+            options=[ft.dropdown.Option(value) for value in _QUALITY_CHOICES],
             width=150
         )
         
         self.format_dropdown = ft.Dropdown(
             label="Format",
             value="MP3",
-            options=[
-                ft.dropdown.Option("MP3"),
-                ft.dropdown.Option("WAV"),
-                ft.dropdown.Option("FLAC"),
-                ft.dropdown.Option("M4A"),
-                ft.dropdown.Option("OGG"),
-            ],
+            options=[ft.dropdown.Option(value) for value in _FORMAT_CHOICES],
             width=150
         )
         
@@ -114,6 +141,9 @@ class AudioPage:
             visible=False
         )
         
+        # Messages, one SnackBar reused for every call
+        self._snack = ft.SnackBar(content=ft.Text(""), open=False)
+        
         # Layout
         return ft.Column([
             # Title
@@ -156,16 +186,31 @@ class AudioPage:
             ])
         ])
     
-    def on_url_change(self, e):
+    async def on_url_change(self, e):
         """Handle URL input changes"""
         url = e.control.value.strip()
         
+        # Restart the wait on every keystroke so only the final value is validated
+        if self._validate_task and not self._validate_task.done():
+            self._validate_task.cancel()
+        
         if not url:
             self.status_text.value = ""
             self.status_text.color = ft.Colors.GREY_600
-        else:
-            # Validate URL
-            is_valid, message = self.platform_manager.validate_url(url)
+            self.status_text.update()
+            return
+        
+        self._validate_task = e.page.run_task(self._run_validation, url)
+    
+    async def _run_validation(self, url: str):
+        """Validate a URL once typing has paused and show the result"""
+        await asyncio.sleep(VALIDATION_DELAY)
+        try:
+            if url == self._last_url:
+                is_valid, message = self._last_validation
+            else:
+                is_valid, message = self.platform_manager.validate_url(url)
+                self._last_url, self._last_validation = url, (is_valid, message)
             
             if is_valid:
                 self.status_text.value = f"✓ {message}"
@@ -173,9 +218,12 @@ class AudioPage:
             else:
                 self.status_text.value = f"✗ {message}"
                 self.status_text.color = ft.Colors.RED
-        
-        # Update UI
-        e.page.update()
+            
+            # Only the status line changed
+            self.status_text.update()
+            
+        except Exception as ex:
+            self.logger.error("Error validating URL: %s", ex)
     
     def start_download(self, e):
         """Start audio download"""
@@ -186,7 +234,10 @@ class AudioPage:
             return
         
         # Validate URL
-        is_valid, message = self.platform_manager.validate_url(url)
+        if url == self._last_url:
+            is_valid, message = self._last_validation
+        else:
+            is_valid, message = self.platform_manager.validate_url(url)
         if not is_valid:
             self.show_error(message)
             return
@@ -221,23 +272,27 @@ class AudioPage:
         if self.current_download and self.current_download.is_alive():
             self.downloader.cancel_download()
             self.progress_text.value = "Cancelling..."
-            e.page.update()
+            self.progress_text.update()
     
     def show_progress(self):
         """Show progress UI"""
-        self.download_button.disabled = True
-        self.cancel_button.visible = True
-        self.progress_bar.visible = True
-        self.progress_text.visible = True
-        self.progress_text.value = "Starting download..."
+        with batch_updates(self.download_button.page):
+            self.download_button.disabled = True
+            self.cancel_button.visible = True
+            self.progress_bar.visible = True
+            self.progress_text.visible = True
+            self.progress_text.value = "Starting download..."
+        self._last_progress = -1.0
+        self._last_progress_ts = 0.0
         
     def hide_progress(self):
         """Hide progress UI"""
-        self.download_button.disabled = False
-        self.cancel_button.visible = False
-        self.progress_bar.visible = False
-        self.progress_text.visible = False
-        self.progress_bar.value = 0
+        with batch_updates(self.download_button.page):
+            self.download_button.disabled = False
+            self.cancel_button.visible = False
+            self.progress_bar.visible = False
+            self.progress_text.visible = False
+            self.progress_bar.value = 0
         
     def on_progress(self, progress_info):
         """Handle download progress"""
@@ -247,14 +302,24 @@ class AudioPage:
             total = progress_info.get('total', 0)
             speed = progress_info.get('speed', 0)
             
+            # Skip redraws that wouldn't visibly change anything, the last one always goes through
+            now = time.monotonic()
+            if (progress < 1.0
+                    and progress - self._last_progress < PROGRESS_STEP
+                    and now - self._last_progress_ts < PROGRESS_INTERVAL):
+                return
+            self._last_progress = progress
+            self._last_progress_ts = now
+            
             # Update progress bar
             self.progress_bar.value = progress
             
             # Update progress text
             if total > 0:
-                downloaded_mb = downloaded / (1024 * 1024)
-                total_mb = total / (1024 * 1024)
-                speed_mb = speed / (1024 * 1024) if speed else 0
+                downloaded_mb = downloaded * _INV_MB
+                total_mb = total * _INV_MB
+                # yt-dlp reports speed as None until it has a measurement
+                speed_mb = (speed or 0) * _INV_MB
                 
                 self.progress_text.value = (
                     f"Downloaded: {downloaded_mb:.1f}MB / {total_mb:.1f}MB "
@@ -262,9 +327,14 @@ class AudioPage:
                 )
             else:
                 self.progress_text.value = "Downloading..."
+            
+            # Send just the two changed controls rather than the whole page
+            if self.progress_bar.page:
+                self.progress_bar.update()
+                self.progress_text.update()
                 
         except Exception as e:
-            self.logger.error(f"Error updating progress: {e}")
+            self.logger.error("Error updating progress: %s", e)
     
     def on_complete(self, success: bool, message: str):
         """Handle download completion"""
@@ -280,16 +350,35 @@ class AudioPage:
                     self.show_error(f"Download failed: {message}")
                     
         except Exception as e:
-            self.logger.error(f"Error in completion handler: {e}")
+            self.logger.error("Error in completion handler: %s", e)
+    
+    def _show_message(self, message: str, color: str):
+        """Show a message in the page's SnackBar"""
+        page = self.status_text.page if self.status_text else None
+        if page is None:
+            # Page isn't on screen yet, fall back to the log
+            self.logger.info(message)
+            return
+        
+        self._snack.content.value = message
+        self._snack.bgcolor = color
+        self._snack.open = True
+        
+        # The SnackBar joins the overlay on first use, after that it redraws on its own
+        if self._snack not in page.overlay:
+            page.overlay.append(self._snack)
+            page.update()
+        else:
+            self._snack.update()
     
     def show_error(self, message: str):
         """Show error message"""
-        print(f"Error: {message}")
+        self._show_message(message, ft.Colors.RED)
         
     def show_success(self, message: str):
         """Show success message"""
-        print(f"Success: {message}")
+        self._show_message(message, ft.Colors.GREEN)
         
     def show_info(self, message: str):
         """Show info message"""
-        print(f"Info: {message}")
+        self._show_message(message, ft.Colors.BLUE)
@@ -2,10 +2,27 @@
 Batch Download Page - Clean and minimal Flet implementation
 """
 
+import threading
+import time
 import flet as ft
+from typing import TYPE_CHECKING
 from ...utils.config import Config
 from ...utils.logger import get_logger
-from ...downloaders.batch_downloader import BatchDownloader, DownloadType
+
+if TYPE_CHECKING:
+    from ...downloaders.batch_downloader import BatchDownloader
+
+# Progress-driven status refreshes closer together than this (seconds) are skipped
+STATUS_INTERVAL = 0.1
+
+# Status events that change the queue counts shown on the page
+_STATUS_UPDATE_EVENTS = frozenset({'batch_started', 'batch_stopped', 'download_completed'})
+
+# Dropdown choices, each page builds its own Option controls from these
+_TYPE_CHOICES = ("Video", "Audio")
+_QUALITY_CHOICES = ("Best", "1080p", "720p", "480p", "360p", "192", "128")
+_FORMAT_CHOICES = ("MP4", "MP3", "WEBM", "MKV")
+_CONCURRENT_CHOICES = ("1", "2", "3", "4", "5")
 
 class BatchPage:
     """Batch download page with clean UI"""
@@ -13,13 +30,7 @@ class BatchPage:
     def __init__(self, config: Config):
         self.config = config
         self.logger = get_logger()
-        self.batch_downloader = BatchDownloader(config)
-        
-        # Set up callbacks
-        self.batch_downloader.set_callbacks(
-            progress_callback=self.on_progress,
-            status_callback=self.on_status_change
-        )
+        self._batch_downloader = None
         
         # UI components
         self.url_textbox = None
@@ -31,7 +42,25 @@ class BatchPage:
         self.start_button = None
         self.stop_button = None
         self.status_text = None
+        self._snack = None
         
+        # When progress last refreshed the status line, and the counts it showed
+        self._last_status_ts = 0.0
+        self._last_status_tuple = None
+        
+    @property
+    def batch_downloader(self) -> "BatchDownloader":
+        """Batch downloader, created with its callbacks on first use"""
+        if self._batch_downloader is None:
+            # Imported here so yt-dlp only loads once the batch queue is used
+            from ...downloaders.batch_downloader import BatchDownloader
+            self._batch_downloader = BatchDownloader(self.config)
+            self._batch_downloader.set_callbacks(
+                progress_callback=self.on_progress,
+                status_callback=self.on_status_change
+            )
+        return self._batch_downloader
+    
     def build(self) -> ft.Control:
         """Build the batch page UI"""
         
@@ -49,50 +78,28 @@ class BatchPage:
         self.type_dropdown = ft.Dropdown(
             label="Type",
             value="Video",
-            options=[
-                ft.dropdown.Option("Video"),
-                ft.dropdown.Option("Audio"),
-            ],
+            options=[ft.dropdown.Option(value) for value in _TYPE_CHOICES],
             width=120
         )
         
         self.quality_dropdown = ft.Dropdown(
             label="Quality",
             value="Best",
-            options=[
-                ft.dropdown.Option("Best"),
-                ft.dropdown.Option("1080p"),
-                ft.dropdown.Option("720p"),
-                ft.dropdown.Option("480p"),
-                ft.dropdown.Option("360p"),
-                ft.dropdown.Option("192"),
-                ft.dropdown.Option("128"),
-            ],
+            options=[ft.dropdown.Option(value) for value in _QUALITY_CHOICES],
             width=120
         )
         
         self.format_dropdown = ft.Dropdown(
             label="Format",
             value="MP4",
-            options=[
-                ft.dropdown.Option("MP4"),
-                ft.dropdown.Option("MP3"),
-                ft.dropdown.Option("WEBM"),
-                ft.dropdown.Option("MKV"),
-            ],
+            options=[ft.dropdown.Option(value) for value in _FORMAT_CHOICES],
             width=120
         )
         
         self.concurrent_dropdown = ft.Dropdown(
             label="Concurrent",
             value="3",
-            options=[
-                ft.dropdown.Option("1"),
-                ft.dropdown.Option("2"),
-                ft.dropdown.Option("3"),
-                ft.dropdown.Option("4"),
-                ft.dropdown.Option("5"),
-            ],
+            options=[ft.dropdown.Option(value) for value in _CONCURRENT_CHOICES],
             width=120
         )
         
@@ -134,6 +141,9 @@ class BatchPage:
             size=14
         )
         
+        # Messages, one SnackBar reused for every call
+        self._snack = ft.SnackBar(content=ft.Text(""), open=False)
+        
         # Layout
         return ft.Column([
             # Title
@@ -180,19 +190,18 @@ class BatchPage:
     
     def add_to_queue(self, e):
         """Add URLs to the download queue"""
-        urls_text = self.url_textbox.value.strip()
-        
-        if not urls_text:
-            self.show_error("Please enter some URLs")
-            return
+        # Parse URLs, stripping each line once and dropping repeats in paste order
+        lines = (line.strip() for line in (self.url_textbox.value or "").splitlines())
+        pasted = [url for url in lines if url]
+        urls = list(dict.fromkeys(pasted))
+        skipped_count = len(pasted) - len(urls)
         
-        # Parse URLs
-        urls = [url.strip() for url in urls_text.split('\n') if url.strip()]
         if not urls:
-            self.show_error("No valid URLs found")
+            self.show_error("Please enter some URLs")
             return
         
         # Get options
+        from ...downloaders.batch_downloader import DownloadType
         download_type = DownloadType.VIDEO if self.type_dropdown.value == "Video" else DownloadType.AUDIO
         quality = self.quality_dropdown.value.lower()
         format_ext = self.format_dropdown.value.lower()
@@ -202,26 +211,46 @@ class BatchPage:
         concurrent = int(self.concurrent_dropdown.value)
         self.batch_downloader.max_concurrent = concurrent
         
-        # Add downloads to queue
-        added_count = 0
-        for url in urls:
-            try:
-                self.batch_downloader.add_download(
-                    url=url,
-                    output_path=output_path,
-                    download_type=download_type,
-                    quality=quality,
-                    format_ext=format_ext
-                )
-                added_count += 1
-            except Exception as ex:
-                self.logger.error(f"Error adding URL {url}: {ex}")
-        
-        # Clear textbox and show success
+        # Clear textbox right away, large pastes are queued in the background
         self.url_textbox.value = ""
-        self.show_success(f"Added {added_count} downloads to queue")
-        self.update_status()
+        self.add_button.disabled = True
+        self.status_text.value = f"Adding {len(urls)} downloads..."
+        self._last_status_tuple = None
         e.page.update()
+        
+        threading.Thread(
+            target=self._enqueue_worker,
+            args=(urls, skipped_count, output_path, download_type, quality, format_ext, e.page),
+            name="BatchEnqueue",
+            daemon=True
+        ).start()
+    
+    def _enqueue_worker(self, urls, skipped_count, output_path, download_type, quality, format_ext, page):
+        """Add downloads to the queue off the UI thread, then refresh the page once"""
+        # Playlists are expanded into their entries here, off the UI thread
+        try:
+            added_count = len(self.batch_downloader.add_bulk_downloads(
+                urls,
+                output_path=output_path,
+                download_type=download_type,
+                quality=quality,
+                format_ext=format_ext
+            ))
+        except Exception as ex:
+            self.logger.error("Error adding URLs: %s", ex)
+            added_count = 0
+        
+        message = f"Added {added_count} downloads to queue"
+        # Past the pending limit the rest wait in the feeder until workers free up room
+        backlog = self.batch_downloader.get_queue_status()['backlog_size']
+        if backlog:
+            message += f" ({backlog} waiting for queue space)"
+        if skipped_count:
+            message += f", skipped {skipped_count} duplicates"
+        self.show_success(message)
+        self.add_button.disabled = False
+        self.update_status()
+        page.update()
     
     def start_batch(self, e):
         """Start the batch download process"""
@@ -245,33 +274,72 @@ class BatchPage:
     
     def on_progress(self, item, progress_info):
         """Handle individual download progress"""
-        # Update status when progress changes
+        # Every active download reports progress, refresh the queue counts at most once per interval
+        now = time.monotonic()
+        if now - self._last_status_ts < STATUS_INTERVAL:
+            return
+        self._last_status_ts = now
+        
         self.update_status()
     
     def on_status_change(self, event_type: str, item):
         """Handle batch status changes"""
-        if event_type in ['batch_started', 'batch_stopped', 'download_completed']:
+        if event_type in _STATUS_UPDATE_EVENTS:
             self.update_status()
     
     def update_status(self):
         """Update the status display"""
         try:
             status = self.batch_downloader.get_queue_status()
+            counts = (
+                status['queue_size'],
+                status['active_downloads'],
+                status['completed_downloads'],
+                status['failed_downloads'],
+            )
+            
+            # Nothing to redraw if the counts haven't moved
+            if counts == self._last_status_tuple:
+                return
+            self._last_status_tuple = counts
             
             self.status_text.value = (
-                f"Queue: {status['queue_size']} pending, "
-                f"{status['active_downloads']} active, "
-                f"{status['completed_downloads']} completed, "
-                f"{status['failed_downloads']} failed"
+                f"Queue: {counts[0]} pending, "
+                f"{counts[1]} active, "
+                f"{counts[2]} completed, "
+                f"{counts[3]} failed"
             )
             
+            # Redraw just the status line
+            if self.status_text.page:
+                self.status_text.update()
+            
         except Exception as e:
-            self.logger.error(f"Error updating status: {e}")
+            self.logger.error("Error updating status: %s", e)
+    
+    def _show_message(self, message: str, color: str):
+        """Show a message in the page's SnackBar"""
+        page = self.status_text.page if self.status_text else None
+        if page is None:
+            # Page isn't on screen yet, fall back to the log
+            self.logger.info(message)
+            return
+        
+        self._snack.content.value = message
+        self._snack.bgcolor = color
+        self._snack.open = True
+        
+        # The SnackBar joins the overlay on first use, after that it redraws on its own
+        if self._snack not in page.overlay:
+            page.overlay.append(self._snack)
+            page.update()
+        else:
+            self._snack.update()
     
     def show_error(self, message: str):
         """Show error message"""
-        print(f"Error: {message}")
+        self._show_message(message, ft.Colors.RED)
         
     def show_success(self, message: str):
         """Show success message"""
-        print(f"Success: {message}")
+        self._show_message(message, ft.Colors.GREEN)
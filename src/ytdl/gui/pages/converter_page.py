@@ -2,11 +2,32 @@
 Format Converter Page - Clean and minimal Flet implementation
 """
 
+import asyncio
+import os
+import threading
+import time
 import flet as ft
 from pathlib import Path
+from typing import TYPE_CHECKING
 from ...utils.config import Config
 from ...utils.logger import get_logger
-from ...converters.format_converter import FormatConverter
+from ...utils.formatting import format_mmss
+from ..updates import batch_updates
+
+if TYPE_CHECKING:
+    from ...converters.format_converter import FormatConverter
+
+# Progress redraws closer together than this (seconds, fraction) are skipped
+PROGRESS_INTERVAL = 0.1
+PROGRESS_STEP = 0.01
+
+# Dropdown choices, each page builds its own Option controls from these
+_FORMAT_CHOICES = ("MP4", "AVI", "MKV", "MOV", "WEBM", "MP3", "WAV", "FLAC", "M4A", "AAC", "OGG")
+_VIDEO_QUALITY_CHOICES = ("Low", "Medium", "High", "Lossless")
+_AUDIO_QUALITY_CHOICES = ("96k", "128k", "192k", "256k", "320k")
+
+# Output formats that take audio bitrate qualities
+_AUDIO_FORMATS = frozenset({'mp3', 'wav', 'flac', 'm4a', 'aac', 'ogg'})
 
 class ConverterPage:
     """Format converter page with clean UI"""
@@ -14,7 +35,7 @@ class ConverterPage:
     def __init__(self, config: Config):
         self.config = config
         self.logger = get_logger()
-        self.converter = FormatConverter(config)
+        self._converter = None
         
         # UI components
         self.input_field = None
@@ -26,9 +47,26 @@ class ConverterPage:
         self.progress_bar = None
         self.progress_text = None
         
-        # Conversion state
-        self.current_conversion = None
+        self._snack = None
+        
+        # Conversion state, progress of each running job keyed by its output path
+        self._active_jobs = {}
+        self._jobs_lock = threading.Lock()
+        
+        # (path, stat) of the last file shown, so converting it needs no second stat
+        self._last_stat = None
+        self._last_progress = -1.0
+        self._last_progress_ts = 0.0
         
+    @property
+    def converter(self) -> "FormatConverter":
+        """Format converter, created on first use"""
+        if self._converter is None:
+            # Imported here so ffmpeg-python only loads once the page needs it
+            from ...converters.format_converter import FormatConverter
+            self._converter = FormatConverter(self.config)
+        return self._converter
+    
     def build(self) -> ft.Control:
         """Build the converter page UI"""
         
@@ -52,23 +90,15 @@ class ConverterPage:
             color=ft.Colors.GREY_600
         )
         
+        # Quality options for video and audio output, swapped on format change
+        self._video_quality_opts = [ft.dropdown.Option(value) for value in _VIDEO_QUALITY_CHOICES]
+        self._audio_quality_opts = [ft.dropdown.Option(value) for value in _AUDIO_QUALITY_CHOICES]
+        
         # Options section
         self.format_dropdown = ft.Dropdown(
             label="Output Format",
             value="MP4",
-            options=[
-                ft.dropdown.Option("MP4"),
-                ft.dropdown.Option("AVI"),
-                ft.dropdown.Option("MKV"),
-                ft.dropdown.Option("MOV"),
-                ft.dropdown.Option("WEBM"),
-                ft.dropdown.Option("MP3"),
-                ft.dropdown.Option("WAV"),
-                ft.dropdown.Option("FLAC"),
-                ft.dropdown.Option("M4A"),
-                ft.dropdown.Option("AAC"),
-                ft.dropdown.Option("OGG"),
-            ],
+            options=[ft.dropdown.Option(value) for value in _FORMAT_CHOICES],
             width=150,
             on_change=self.on_format_change
         )
@@ -76,12 +106,7 @@ class ConverterPage:
         self.quality_dropdown = ft.Dropdown(
             label="Quality",
             value="Medium",
-            options=[
-                ft.dropdown.Option("Low"),
-                ft.dropdown.Option("Medium"),
-                ft.dropdown.Option("High"),
-                ft.dropdown.Option("Lossless"),
-            ],
+            options=self._video_quality_opts,
             width=150
         )
         
@@ -119,6 +144,9 @@ class ConverterPage:
             visible=False
         )
         
+        # Messages, one SnackBar reused for every call
+        self._snack = ft.SnackBar(content=ft.Text(""), open=False)
+        
         # Layout
         return ft.Column([
             # Title
@@ -161,7 +189,7 @@ class ConverterPage:
             ])
         ])
     
-    def browse_file(self, e):
+    async def browse_file(self, e):
         """Browse for input file"""
         # In a real implementation, this would open a file picker
         # For now, we'll simulate it
@@ -170,60 +198,60 @@ class ConverterPage:
         # Simulate file selection
         file_path = "/path/to/example.mp4"
         self.input_field.value = file_path
-        self.update_file_info(file_path)
-        e.page.update()
+        # Probing the file runs ffprobe, keep it off the event loop
+        await asyncio.to_thread(self.update_file_info, file_path)
+        e.page.update(self.input_field, self.file_info_text)
     
     def update_file_info(self, file_path: str):
         """Update file information display"""
         try:
-            if Path(file_path).exists():
-                info = self.converter.get_file_info(file_path)
-                
-                # Format duration
-                duration = info.get('duration', 0)
-                duration_str = f"{int(duration//60):02d}:{int(duration%60):02d}"
-                
-                # Format file size
-                size = info.get('size', 0)
-                size_mb = size / (1024 * 1024)
-                
-                self.file_info_text.value = f"Duration: {duration_str}, Size: {size_mb:.1f}MB"
-                self.file_info_text.color = ft.Colors.GREEN
-            else:
-                self.file_info_text.value = "File not found"
-                self.file_info_text.color = ft.Colors.RED
+            # One stat both checks the file exists and keys the converter's probe cache
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            self._last_stat = None
+            self.file_info_text.value = "File not found"
+            self.file_info_text.color = ft.Colors.RED
+            return
+        except OSError as e:
+            self._last_stat = None
+            self.file_info_text.value = f"Error reading file: {str(e)}"
+            self.file_info_text.color = ft.Colors.RED
+            return
+        self._last_stat = (file_path, st)
+        
+        try:
+            info = self.converter.get_file_info(file_path, st)
+            
+            # Format duration
+            duration = info.get('duration', 0)
+            duration_str = format_mmss(int(duration))
+            
+            # Format file size, straight from the stat
+            size_mb = st.st_size / (1024 * 1024)
+            
+            self.file_info_text.value = f"Duration: {duration_str}, Size: {size_mb:.1f}MB"
+            self.file_info_text.color = ft.Colors.GREEN
                 
         except Exception as e:
             self.file_info_text.value = f"Error reading file: {str(e)}"
             self.file_info_text.color = ft.Colors.RED
     
-    def on_format_change(self, e):
+    async def on_format_change(self, e):
         """Handle format selection change"""
         format_name = e.control.value.lower()
         
-        if format_name in ['mp3', 'wav', 'flac', 'm4a', 'aac', 'ogg']:
+        if format_name in _AUDIO_FORMATS:
             # Audio format - different quality options
-            self.quality_dropdown.options = [
-                ft.dropdown.Option("96k"),
-                ft.dropdown.Option("128k"),
-                ft.dropdown.Option("192k"),
-                ft.dropdown.Option("256k"),
-                ft.dropdown.Option("320k"),
-            ]
+            self.quality_dropdown.options = self._audio_quality_opts
             self.quality_dropdown.value = "192k"
         else:
             # Video format - standard quality options
-            self.quality_dropdown.options = [
-                ft.dropdown.Option("Low"),
-                ft.dropdown.Option("Medium"),
-                ft.dropdown.Option("High"),
-                ft.dropdown.Option("Lossless"),
-            ]
+            self.quality_dropdown.options = self._video_quality_opts
             self.quality_dropdown.value = "Medium"
         
-        e.page.update()
+        self.quality_dropdown.update()
     
-    def start_conversion(self, e):
+    async def start_conversion(self, e):
         """Start file conversion"""
         input_path = self.input_field.value.strip()
         
@@ -231,14 +259,17 @@ class ConverterPage:
             self.show_error("Please select an input file")
             return
         
-        if not Path(input_path).exists():
-            self.show_error("Input file does not exist")
-            return
-        
-        # Check if conversion is active
-        if self.current_conversion and self.current_conversion.is_alive():
-            self.show_error("A conversion is already in progress")
-            return
+        # The file shown by browse was just stat'ed, only other paths need checking
+        if not (self._last_stat and self._last_stat[0] == input_path):
+            try:
+                self._last_stat = (input_path, os.stat(input_path))
+            except FileNotFoundError:
+                self.show_error("Input file does not exist")
+                return
+            except OSError as ex:
+                self.show_error(f"Cannot read input file: {str(ex)}")
+                return
+        input_stat = self._last_stat[1]
         
         # Get options
         output_format = self.format_dropdown.value.lower()
@@ -248,69 +279,129 @@ class ConverterPage:
         # Generate output filename
         input_file = Path(input_path)
         output_filename = f"{input_file.stem}.{output_format}"
-        output_path = Path(output_dir) / output_filename
+        output_path = str(Path(output_dir) / output_filename)
+        
+        # Claimed before the first await so a double-click can't start a second
+        # FFmpeg writing the same file
+        with self._jobs_lock:
+            already_running = output_path in self._active_jobs
+            if not already_running:
+                first_job = not self._active_jobs
+                self._active_jobs[output_path] = 0.0
         
-        # Show progress
-        self.show_progress()
+        if already_running:
+            self.show_error("A conversion is already in progress")
+            return
+        
+        # Show progress when nothing else is converting
+        if first_job:
+            self.show_progress()
+        
+        try:
+            # The first conversion imports ffmpeg-python, keep that off the event loop
+            converter = await asyncio.to_thread(lambda: self.converter)
+        except Exception as ex:
+            self.on_complete(output_path, False, str(ex))
+            return
         
-        # Start conversion in thread
-        self.current_conversion = self.converter.convert_file_async(
+        from ...converters.format_converter import ConversionJob
+        job = ConversionJob(
             input_path=input_path,
-            output_path=str(output_path),
+            output_path=output_path,
             output_format=output_format,
             quality=quality,
-            progress_callback=self.on_progress,
-            completion_callback=self.on_complete
+            input_stat=input_stat
+        )
+        
+        # Jobs share the converter's worker pool, so several files convert at once
+        future = converter.submit_batch(
+            [job],
+            progress_callback=lambda job, info: self.on_progress(job.output_path, info),
+            completion_callback=lambda job, ok, msg: self.on_complete(job.output_path, ok, msg)
+        )[0]
+        # Jobs cancelled before they start never report completion
+        future.add_done_callback(
+            lambda f: f.cancelled() and self.on_complete(output_path, False, "Conversion cancelled by user")
         )
     
-    def cancel_conversion(self, e):
-        """Cancel current conversion"""
-        if self.current_conversion and self.current_conversion.is_alive():
+    async def cancel_conversion(self, e):
+        """Cancel all running and queued conversions"""
+        if self._active_jobs:
             self.converter.cancel_conversion()
             self.progress_text.value = "Cancelling..."
-            e.page.update()
+            self.progress_text.update()
     
     def show_progress(self):
         """Show progress UI"""
-        self.convert_button.disabled = True
-        self.cancel_button.visible = True
-        self.progress_bar.visible = True
-        self.progress_text.visible = True
-        self.progress_text.value = "Starting conversion..."
+        with batch_updates(self.convert_button.page):
+            self.cancel_button.visible = True
+            self.progress_bar.visible = True
+            self.progress_text.visible = True
+            self.progress_text.value = "Starting conversion..."
+        self._last_progress = -1.0
+        self._last_progress_ts = 0.0
         
     def hide_progress(self):
         """Hide progress UI"""
-        self.convert_button.disabled = False
-        self.cancel_button.visible = False
-        self.progress_bar.visible = False
-        self.progress_text.visible = False
-        self.progress_bar.value = 0
+        with batch_updates(self.convert_button.page):
+            self.cancel_button.visible = False
+            self.progress_bar.visible = False
+            self.progress_text.visible = False
+            self.progress_bar.value = 0
         
-    def on_progress(self, progress_info):
+    def on_progress(self, output_path: str, progress_info):
         """Handle conversion progress"""
         try:
-            progress = progress_info.get('progress', 0)
             current_time = progress_info.get('current_time', 0)
             total_time = progress_info.get('total_time', 0)
             
+            with self._jobs_lock:
+                if output_path not in self._active_jobs:
+                    return
+                self._active_jobs[output_path] = progress_info.get('progress', 0)
+                job_count = len(self._active_jobs)
+                # Several jobs share one bar, show their average
+                progress = sum(self._active_jobs.values()) / job_count
+            
+            # Skip redraws that wouldn't visibly change anything, the last one always goes through
+            now = time.monotonic()
+            if (progress < 1.0
+                    and progress - self._last_progress < PROGRESS_STEP
+                    and now - self._last_progress_ts < PROGRESS_INTERVAL):
+                return
+            self._last_progress = progress
+            self._last_progress_ts = now
+            
             # Update progress bar
             self.progress_bar.value = progress
             
             # Update progress text
-            if total_time > 0:
-                current_str = f"{int(current_time//60):02d}:{int(current_time%60):02d}"
-                total_str = f"{int(total_time//60):02d}:{int(total_time%60):02d}"
+            if job_count > 1:
+                self.progress_text.value = f"Converting {job_count} files ({progress*100:.1f}%)"
+            elif total_time > 0:
+                current_str = format_mmss(int(current_time))
+                total_str = format_mmss(int(total_time))
                 self.progress_text.value = f"Converting: {current_str} / {total_str} ({progress*100:.1f}%)"
             else:
                 self.progress_text.value = "Converting..."
+            
+            # Send just the two changed controls rather than the whole page
+            if self.progress_bar.page:
+                self.progress_bar.update()
+                self.progress_text.update()
                 
         except Exception as e:
-            self.logger.error(f"Error updating progress: {e}")
+            self.logger.error("Error updating progress: %s", e)
     
-    def on_complete(self, success: bool, message: str):
+    def on_complete(self, output_path: str, success: bool, message: str):
         """Handle conversion completion"""
         try:
-            self.hide_progress()
+            with self._jobs_lock:
+                self._active_jobs.pop(output_path, None)
+                last_job = not self._active_jobs
+            
+            if last_job:
+                self.hide_progress()
             
             if success:
                 self.show_success("File converted successfully!")
@@ -321,16 +412,35 @@ class ConverterPage:
                     self.show_error(f"Conversion failed: {message}")
                     
         except Exception as e:
-            self.logger.error(f"Error in completion handler: {e}")
+            self.logger.error("Error in completion handler: %s", e)
+    
+    def _show_message(self, message: str, color: str):
+        """Show a message in the page's SnackBar"""
+        page = self.convert_button.page if self.convert_button else None
+        if page is None:
+            # Page isn't on screen yet, fall back to the log
+            self.logger.info(message)
+            return
+        
+        self._snack.content.value = message
+        self._snack.bgcolor = color
+        self._snack.open = True
+        
+        # The SnackBar joins the overlay on first use, after that it redraws on its own
+        if self._snack not in page.overlay:
+            page.overlay.append(self._snack)
+            page.update()
+        else:
+            self._snack.update()
     
     def show_error(self, message: str):
         """Show error message"""
-        print(f"Error: {message}")
+        self._show_message(message, ft.Colors.RED)
         
     def show_success(self, message: str):
         """Show success message"""
-        print(f"Success: {message}")
+        self._show_message(message, ft.Colors.GREEN)
         
     def show_info(self, message: str):
         """Show info message"""
-        print(f"Info: {message}")
+        self._show_message(message, ft.Colors.BLUE)
@@ -2,11 +2,18 @@
 Settings Page - Clean and minimal Flet implementation
 """
 
+import asyncio
 import flet as ft
 from typing import Callable
 from ...utils.config import Config
 from ...utils.logger import get_logger
 
+# Dropdown choices, each page builds its own Option controls from these
+_THEME_CHOICES = ("Dark", "Light", "Kawaii")
+_VIDEO_QUALITY_CHOICES = ("best", "1080p", "720p", "480p", "360p")
+_AUDIO_QUALITY_CHOICES = ("320", "256", "192", "128", "96")
+_CONCURRENT_CHOICES = ("1", "2", "3", "4", "5")
+
 class SettingsPage:
     """Settings page with clean UI"""
     
@@ -30,11 +37,7 @@ class SettingsPage:
         self.theme_dropdown = ft.Dropdown(
             label="Theme",
             value=self.config.get('theme_mode', 'dark').title(),
-            options=[
-                ft.dropdown.Option("Dark"),
-                ft.dropdown.Option("Light"),
-                ft.dropdown.Option("Kawaii"),
-            ],
+            options=[ft.dropdown.Option(value) for value in _THEME_CHOICES],
             width=150,
             on_change=self.on_theme_change
         )
@@ -56,13 +59,7 @@ class SettingsPage:
         self.video_quality_dropdown = ft.Dropdown(
             label="Default Video Quality",
             value=self.config.get('video_quality', 'best'),
-            options=[
-                ft.dropdown.Option("best"),
-                ft.dropdown.Option("1080p"),
-                ft.dropdown.Option("720p"),
-                ft.dropdown.Option("480p"),
-                ft.dropdown.Option("360p"),
-            ],
+            options=[ft.dropdown.Option(value) for value in _VIDEO_QUALITY_CHOICES],
             width=150
         )
         
@@ -70,13 +67,7 @@ class SettingsPage:
         self.audio_quality_dropdown = ft.Dropdown(
             label="Default Audio Quality",
             value=self.config.get('audio_quality', '192'),
-            options=[
-                ft.dropdown.Option("320"),
-                ft.dropdown.Option("256"),
-                ft.dropdown.Option("192"),
-                ft.dropdown.Option("128"),
-                ft.dropdown.Option("96"),
-            ],
+            options=[ft.dropdown.Option(value) for value in _AUDIO_QUALITY_CHOICES],
             width=150
         )
         
@@ -84,13 +75,7 @@ class SettingsPage:
         self.concurrent_dropdown = ft.Dropdown(
             label="Concurrent Downloads",
             value=str(self.config.get('concurrent_downloads', 3)),
-            options=[
-                ft.dropdown.Option("1"),
-                ft.dropdown.Option("2"),
-                ft.dropdown.Option("3"),
-                ft.dropdown.Option("4"),
-                ft.dropdown.Option("5"),
-            ],
+            options=[ft.dropdown.Option(value) for value in _CONCURRENT_CHOICES],
             width=150
         )
         
@@ -176,16 +161,16 @@ class SettingsPage:
             )
         ])
     
-    def on_theme_change(self, e):
+    async def on_theme_change(self, e):
         """Handle theme change"""
         theme_name = e.control.value.lower()
         
         # Apply theme immediately
         self.theme_callback(theme_name)
         
-        self.logger.info(f"Theme changed to: {theme_name}")
+        self.logger.info("Theme changed to: %s", theme_name)
     
-    def browse_directory(self, e):
+    async def browse_directory(self, e):
         """Browse for download directory"""
         # In a real implementation, this would open a directory picker
         # For now, we'll simulate it
@@ -194,16 +179,21 @@ class SettingsPage:
         # Simulate directory selection
         directory = "/path/to/downloads"
         self.download_dir_field.value = directory
-        e.page.update()
+        self.download_dir_field.update()
     
-    def save_settings(self, e):
+    async def save_settings(self, e):
         """Save all settings"""
         try:
-            # Save all settings to config
-            self.config.set('download_directory', self.download_dir_field.value)
-            self.config.set('video_quality', self.video_quality_dropdown.value)
-            self.config.set('audio_quality', self.audio_quality_dropdown.value)
-            self.config.set('concurrent_downloads', int(self.concurrent_dropdown.value))
+            settings = {
+                'download_directory': self.download_dir_field.value,
+                'video_quality': self.video_quality_dropdown.value,
+                'audio_quality': self.audio_quality_dropdown.value,
+                'concurrent_downloads': int(self.concurrent_dropdown.value),
+            }
+            
+            # One config write for the whole form, flushed now and kept off the event loop
+            self.config.update(settings)
+            await asyncio.to_thread(self.config.save)
             
             # Show success message
             self.show_success("Settings saved successfully!")
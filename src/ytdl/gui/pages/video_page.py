@@ -2,21 +2,42 @@
 Video Download Page - Clean and minimal Flet implementation
 """
 
+import asyncio
 import flet as ft
+from typing import Optional, TYPE_CHECKING
 import threading
+import time
 from ...utils.config import Config
 from ...utils.logger import get_logger
-from ...downloaders.video_downloader import VideoDownloader
 from ...downloaders.platform_manager import PlatformManager
+from ..updates import batch_updates
+
+if TYPE_CHECKING:
+    from ...downloaders.video_downloader import VideoDownloader
+
+# Progress redraws closer together than this (seconds, fraction) are skipped
+PROGRESS_INTERVAL = 0.1
+PROGRESS_STEP = 0.01
+
+# URL validation waits until typing pauses for this long (seconds)
+VALIDATION_DELAY = 0.25
+
+# Bytes to megabytes, as a multiplier
+_INV_MB = 1.0 / (1024 * 1024)
+
+# Dropdown choices, each page builds its own Option controls from these
+_QUALITY_CHOICES = ("Best", "1080p", "720p", "480p", "360p", "Audio Only")
+_FORMAT_CHOICES = ("MP4", "WEBM", "MKV", "MP3")
 
 class VideoPage:
     """Video download page with clean UI"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, platform_manager: Optional[PlatformManager] = None):
         self.config = config
         self.logger = get_logger()
-        self.downloader = VideoDownloader(config)
-        self.platform_manager = PlatformManager()
+        self._downloader = None
+        # Shared with the other pages when the app passes one in
+        self.platform_manager = platform_manager or PlatformManager()
         
         # UI components
         self.url_field = None
@@ -28,9 +49,26 @@ class VideoPage:
         self.progress_bar = None
         self.progress_text = None
         
-        # Download state
+        # Download state, _starting covers the await before current_download is set
         self.current_download = None
+        self._starting = False
+        self._last_progress = -1.0
+        self._last_progress_ts = 0.0
+        
+        # URL validation state, the last result is reused for an unchanged URL
+        self._last_url = None
+        self._last_validation = None
+        self._validate_task = None
         
+    @property
+    def downloader(self) -> "VideoDownloader":
+        """Video downloader, created on first download"""
+        if self._downloader is None:
+            # Imported here so yt-dlp only loads once a download starts
+            from ...downloaders.video_downloader import VideoDownloader
+            self._downloader = VideoDownloader(self.config)
+        return self._downloader
+    
     def build(self) -> ft.Control:
         """Build the video page UI"""
         
@@ -52,26 +90,14 @@ class VideoPage:
         self.quality_dropdown = ft.Dropdown(
             label="Quality",
             value="Best",
-            options=[
-                ft.dropdown.Option("Best"),
-                ft.dropdown.Option("1080p"),
-                ft.dropdown.Option("720p"),
-                ft.dropdown.Option("480p"),
-                ft.dropdown.Option("360p"),
-                ft.dropdown.Option("Audio Only"),
-            ],
+            options=[ft.dropdown.Option(value) for value in _QUALITY_CHOICES],
             width=150
         )
         
         self.format_dropdown = ft.Dropdown(
             label="Format",
             value="MP4",
-            options=[
-                ft.dropdown.Option("MP4"),
-                ft.dropdown.Option("WEBM"),
-                ft.dropdown.Option("MKV"),
-                ft.dropdown.Option("MP3"),
-            ],
+            options=[ft.dropdown.Option(value) for value in _FORMAT_CHOICES],
             width=150
         )
         
@@ -148,16 +174,31 @@ class VideoPage:
             ])
         ])
     
-    def on_url_change(self, e):
+    async def on_url_change(self, e):
         """Handle URL input changes"""
         url = e.control.value.strip()
         
+        # Restart the wait on every keystroke so only the final value is validated
+        if self._validate_task and not self._validate_task.done():
+            self._validate_task.cancel()
+        
         if not url:
             self.status_text.value = ""
             self.status_text.color = ft.Colors.GREY_600
-        else:
-            # Validate URL
-            is_valid, message = self.platform_manager.validate_url(url)
+            self.status_text.update()
+            return
+        
+        self._validate_task = e.page.run_task(self._run_validation, url)
+    
+    async def _run_validation(self, url: str):
+        """Validate a URL once typing has paused and show the result"""
+        await asyncio.sleep(VALIDATION_DELAY)
+        try:
+            if url == self._last_url:
+                is_valid, message = self._last_validation
+            else:
+                is_valid, message = self.platform_manager.validate_url(url)
+                self._last_url, self._last_validation = url, (is_valid, message)
             
             if is_valid:
                 self.status_text.value = f"✓ {message}"
@@ -165,11 +206,14 @@ class VideoPage:
             else:
                 self.status_text.value = f"✗ {message}"
                 self.status_text.color = ft.Colors.RED
-        
-        # Update UI
-        e.page.update()
+            
+            # Only the status line changed
+            self.status_text.update()
+            
+        except Exception as ex:
+            self.logger.error("Error validating URL: %s", ex)
     
-    def start_download(self, e):
+    async def start_download(self, e):
         """Start video download"""
         url = self.url_field.value.strip()
         
@@ -178,13 +222,16 @@ class VideoPage:
             return
         
         # Validate URL
-        is_valid, message = self.platform_manager.validate_url(url)
+        if url == self._last_url:
+            is_valid, message = self._last_validation
+        else:
+            is_valid, message = self.platform_manager.validate_url(url)
         if not is_valid:
             self.show_error(message)
             return
         
         # Check if download is active
-        if self.current_download and self.current_download.is_alive():
+        if self._starting or (self.current_download and self.current_download.is_alive()):
             self.show_error("A download is already in progress")
             return
         
@@ -193,41 +240,55 @@ class VideoPage:
         format_ext = self.format_dropdown.value.lower()
         output_path = str(self.config.get_download_directory())
         
-        # Show progress
+        # Show progress, claiming the page before the first await
+        self._starting = True
         self.show_progress()
         
-        # Start download in thread
-        self.current_download = self.downloader.download_video_async(
-            url=url,
-            output_path=output_path,
-            quality=quality,
-            format_ext=format_ext,
-            progress_callback=self.on_progress,
-            completion_callback=self.on_complete
-        )
+        try:
+            # The first download imports yt-dlp, keep that off the event loop
+            downloader = await asyncio.to_thread(lambda: self.downloader)
+            
+            # Start download in thread
+            self.current_download = downloader.download_video_async(
+                url=url,
+                output_path=output_path,
+                quality=quality,
+                format_ext=format_ext,
+                progress_callback=self.on_progress,
+                completion_callback=self.on_complete
+            )
+        except Exception as ex:
+            self.hide_progress()
+            self.show_error(f"Could not start download: {str(ex)}")
+        finally:
+            self._starting = False
     
-    def cancel_download(self, e):
+    async def cancel_download(self, e):
         """Cancel current download"""
         if self.current_download and self.current_download.is_alive():
             self.downloader.cancel_download()
             self.progress_text.value = "Cancelling..."
-            e.page.update()
+            self.progress_text.update()
     
     def show_progress(self):
         """Show progress UI"""
-        self.download_button.disabled = True
-        self.cancel_button.visible = True
-        self.progress_bar.visible = True
-        self.progress_text.visible = True
-        self.progress_text.value = "Starting download..."
+        with batch_updates(self.download_button.page):
+            self.download_button.disabled = True
+            self.cancel_button.visible = True
+            self.progress_bar.visible = True
+            self.progress_text.visible = True
+            self.progress_text.value = "Starting download..."
+        self._last_progress = -1.0
+        self._last_progress_ts = 0.0
         
     def hide_progress(self):
         """Hide progress UI"""
-        self.download_button.disabled = False
-        self.cancel_button.visible = False
-        self.progress_bar.visible = False
-        self.progress_text.visible = False
-        self.progress_bar.value = 0
+        with batch_updates(self.download_button.page):
+            self.download_button.disabled = False
+            self.cancel_button.visible = False
+            self.progress_bar.visible = False
+            self.progress_text.visible = False
+            self.progress_bar.value = 0
         
     def on_progress(self, progress_info):
         """Handle download progress"""
@@ -237,14 +298,24 @@ class VideoPage:
             total = progress_info.get('total', 0)
             speed = progress_info.get('speed', 0)
             
+            # Skip redraws that wouldn't visibly change anything, the last one always goes through
+            now = time.monotonic()
+            if (progress < 1.0
+                    and progress - self._last_progress < PROGRESS_STEP
+                    and now - self._last_progress_ts < PROGRESS_INTERVAL):
+                return
+            self._last_progress = progress
+            self._last_progress_ts = now
+            
             # Update progress bar
             self.progress_bar.value = progress
             
             # Update progress text
             if total > 0:
-                downloaded_mb = downloaded / (1024 * 1024)
-                total_mb = total / (1024 * 1024)
-                speed_mb = speed / (1024 * 1024) if speed else 0
+                downloaded_mb = downloaded * _INV_MB
+                total_mb = total * _INV_MB
+                # yt-dlp reports speed as None until it has a measurement
+                speed_mb = (speed or 0) * _INV_MB
                 
                 self.progress_text.value = (
                     f"Downloaded: {downloaded_mb:.1f}MB / {total_mb:.1f}MB "
@@ -252,9 +323,14 @@ class VideoPage:
                 )
             else:
                 self.progress_text.value = "Downloading..."
+            
+            # Send just the two changed controls rather than the whole page
+            if self.progress_bar.page:
+                self.progress_bar.update()
+                self.progress_text.update()
                 
         except Exception as e:
-            self.logger.error(f"Error updating progress: {e}")
+            self.logger.error("Error updating progress: %s", e)
     
     def on_complete(self, success: bool, message: str):
         """Handle download completion"""
@@ -270,7 +346,7 @@ class VideoPage:
                     self.show_error(f"Download failed: {message}")
                     
         except Exception as e:
-            self.logger.error(f"Error in completion handler: {e}")
+            self.logger.error("Error in completion handler: %s", e)
     
     def show_error(self, message: str):
         """Show error message"""
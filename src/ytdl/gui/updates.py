@@ -0,0 +1,25 @@
+"""
+Batched UI update helpers for YTDL application
+"""
+
+import threading
+from contextlib import contextmanager
+
+# Nesting depth of batch_updates on the current thread
+_state = threading.local()
+
+@contextmanager
+def batch_updates(page):
+    """Apply several control changes with a single page update
+
+    Nested blocks only update the page when the outermost one exits.
+    """
+    depth = getattr(_state, 'depth', 0)
+    _state.depth = depth + 1
+    try:
+        yield
+    finally:
+        _state.depth = depth
+
+    if depth == 0 and page is not None:
+        page.update()
@@ -4,26 +4,42 @@ YTDL - All-in-One Video/Audio Downloader GUI Application
 Main application entry point using Flet
 """
 
+import asyncio
+import logging
+import sys
 import flet as ft
 from .gui.app import YTDLApp
-from .utils.config import Config
+from .utils.config import get_config
 from .utils.logger import setup_logger
 
 def main():
     """Main application entry point"""
     try:
+        # The app's log format never shows process or task names, so skip collecting
+        # them for every record. These are process-wide, only the app sets them.
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        logging.logAsyncioTasks = False
+
         # Setup logging
         logger = setup_logger()
         logger.info("Starting YTDL Flet Application")
 
         # Initialize configuration
-        config = Config()
+        config = get_config()
 
         # Create and run the Flet app
         def create_app(page: ft.Page):
             app = YTDLApp(page, config)
             app.build()
 
+        # Use uvloop for the app's event loop when it's installed (not available on Windows)
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
         # Run the Flet application
         ft.app(
             target=create_app,
@@ -31,9 +47,14 @@ def main():
             assets_dir="assets"
         )
 
+        # concurrent.futures joins pool workers before atexit handlers run, so
+        # stop running conversions here rather than wait for them to finish
+        format_converter = sys.modules.get(f'{__package__}.converters.format_converter')
+        if format_converter is not None:
+            format_converter.shutdown_converters()
+
     except Exception as e:
         print(f"Failed to start YTDL application: {e}")
-        import sys
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -2,76 +2,244 @@
 Configuration management for YTDL application
 """
 
+import atexit
+import copy
+import functools
 import json
 import os
+import threading
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, Optional
+from .logger import get_logger
+
+# orjson is faster when installed, saves are compact and exports are indented
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+    
+    def _dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    
+    def _dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+# Changes are written to disk once no further change arrives for this long (seconds)
+SAVE_DELAY = 0.5
+
+# Config locations, resolved once per process
+_HOME = os.path.expanduser('~')
+_CONFIG_DIR = os.path.join(_HOME, '.ytdl')
+_CONFIG_FILE = os.path.join(_CONFIG_DIR, 'config.json')
+
+# Parsed config files by path, as (st_mtime_ns, merged config), reused while the file is unchanged
+_CONFIG_CACHE: Dict[str, tuple] = {}
+
+# Default configuration, list values are stored as tuples and copied out as lists
+_DEFAULTS = MappingProxyType({
+    'appearance_mode': 'dark',
+    'color_theme': 'blue',
+    'download_directory': os.path.join(_HOME, 'Downloads', 'YTDL'),
+    'video_quality': 'best',
+    'audio_quality': '192',
+    'concurrent_downloads': 3,
+    'history_size': 500,
+    'write_info_json': False,
+    'enable_notifications': True,
+    'auto_convert': False,
+    'keep_original': True,
+    'subtitle_languages': ('en',),
+    'window_geometry': '1200x800',
+    'theme_mode': 'dark',  # 'dark', 'light', 'kawaii'
+})
+
+# Defaults stored as tuples, each Config gets its own list copy
+_LIST_DEFAULT_KEYS = tuple(key for key, value in _DEFAULTS.items() if isinstance(value, tuple))
+
+# Encoded defaults, written as-is when the config is saved right after a reset
+_DEFAULT_BYTES = _dumps(dict(_DEFAULTS))
+
+# Shared instance handed out by get_config()
+_instance: Optional['Config'] = None
+_instance_lock = threading.Lock()
 
 class Config:
     """Configuration manager for YTDL application"""
     
     def __init__(self):
-        self.config_dir = Path.home() / '.ytdl'
-        self.config_file = self.config_dir / 'config.json'
-        self._config = self._load_config()
+        self.config_dir = _CONFIG_DIR
+        self.config_file = _CONFIG_FILE
+        self.logger = get_logger()
+        self._download_dir: Optional[Path] = None
+        # Download directory last created by ensure_download_directory()
+        self._ensured_dir: Optional[Path] = None
+        
+        # Pending write state, a burst of changes is saved once
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._dir_ready = False
+        # True while the values are untouched defaults from reset_to_defaults()
+        self._is_default = False
+        atexit.register(self.save)
+    
+    @functools.cached_property
+    def _config(self) -> Dict[str, Any]:
+        """Configuration values, read from disk on first access"""
+        return self._load_config()
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from file or create default"""
-        if self.config_file.exists():
+        """Load configuration from file on top of the defaults"""
+        # Open first and stat the open file, a missing file costs a single failed open
+        try:
+            fd = os.open(self.config_file, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        except FileNotFoundError:
+            return self._get_default_config()
+        except OSError as e:
+            self.logger.warning("Could not read configuration: %s", e)
+            return self._get_default_config()
+        
+        try:
+            st = os.fstat(fd)
+            
+            # Another instance already parsed this version of the file
+            cached = _CONFIG_CACHE.get(self.config_file)
+            if cached and cached[0] == st.st_mtime_ns:
+                return copy.deepcopy(cached[1])
+            
+            # Every known key is present afterwards, so get() never falls back for them
+            config = self._get_default_config()
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                # The file is small, so read it whole with one unbuffered read
+                loaded = _loads(os.read(fd, st.st_size))
+                if isinstance(loaded, dict):
+                    config.update(loaded)
+            except (_JSONDecodeError, UnicodeDecodeError, OSError):
                 pass
+        finally:
+            os.close(fd)
         
-        # Return default configuration
-        return self._get_default_config()
+        _CONFIG_CACHE[self.config_file] = (st.st_mtime_ns, copy.deepcopy(config))
+        return config
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration"""
-        return {
-            'appearance_mode': 'dark',
-            'color_theme': 'blue',
-            'download_directory': str(Path.home() / 'Downloads' / 'YTDL'),
-            'video_quality': 'best',
-            'audio_quality': '192',
-            'concurrent_downloads': 3,
-            'enable_notifications': True,
-            'auto_convert': False,
-            'keep_original': True,
-            'subtitle_languages': ['en'],
-            'window_geometry': '1200x800',
-            'theme_mode': 'dark',  # 'dark', 'light', 'kawaii'
-        }
+        config = dict(_DEFAULTS)
+        for key in _LIST_DEFAULT_KEYS:
+            config[key] = list(config[key])
+        return config
     
     def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value"""
+        """Get configuration value, default only applies to unknown keys"""
         return self._config.get(key, default)
     
     def set(self, key: str, value: Any) -> None:
         """Set configuration value"""
-        self._config[key] = value
-        self._save_config()
+        with self._lock:
+            self._config[key] = value
+            self._is_default = False
+            if key == 'download_directory':
+                self._download_dir = None
+            self._schedule_save()
+    
+    def update(self, values: Dict[str, Any]) -> None:
+        """Set several configuration values with a single write"""
+        with self._lock:
+            self._config.update(values)
+            self._is_default = False
+            if 'download_directory' in values:
+                self._download_dir = None
+            self._schedule_save()
+    
+    def save(self) -> None:
+        """Write pending changes to the config file now"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._save_config()
+    
+    def _schedule_save(self) -> None:
+        """Mark the config changed and restart the save timer"""
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(SAVE_DELAY, self.save)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
     
     def _save_config(self) -> None:
         """Save configuration to file"""
         try:
-            self.config_dir.mkdir(exist_ok=True)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=2)
+            # The directory only needs creating before the first save
+            if not self._dir_ready:
+                os.makedirs(self.config_dir, exist_ok=True)
+                self._dir_ready = True
+            # Write beside the real file and swap it in, so a crash never leaves it half written
+            tmp_file = self.config_file + '.tmp'
+            data = _DEFAULT_BYTES if self._is_default else _dumps(self._config)
+            # Already encoded, so skip the buffer and hand it to a single write
+            with open(tmp_file, 'wb', buffering=0) as f:
+                f.write(data)
+            os.replace(tmp_file, self.config_file)
+            _CONFIG_CACHE[self.config_file] = (
+                os.stat(self.config_file).st_mtime_ns, copy.deepcopy(self._config)
+            )
         except IOError as e:
-            print(f"Warning: Could not save configuration: {e}")
+            self.logger.warning("Could not save configuration: %s", e)
+    
+    def export_pretty(self, path: str) -> None:
+        """Write an indented, human-readable copy of the configuration"""
+        with self._lock:
+            data = _dumps_pretty(self._config)
+        with open(path, 'wb') as f:
+            f.write(data)
     
     def reset_to_defaults(self) -> None:
         """Reset configuration to defaults"""
-        self._config = self._get_default_config()
-        self._save_config()
+        with self._lock:
+            self._config = self._get_default_config()
+            self._is_default = True
+            self._download_dir = None
+            self._schedule_save()
     
     def get_download_directory(self) -> Path:
         """Get download directory as Path object"""
-        return Path(self.get('download_directory'))
+        # Built once, set() drops it when the directory changes
+        if self._download_dir is None:
+            self._download_dir = Path(self.get('download_directory'))
+        return self._download_dir
     
     def ensure_download_directory(self) -> None:
         """Ensure download directory exists"""
         download_dir = self.get_download_directory()
+        # A new Path is built whenever the setting changes, so identity tells us it was
+        # created, is_dir() catches the folder being deleted or moved since
+        if download_dir is self._ensured_dir and download_dir.is_dir():
+            return
         download_dir.mkdir(parents=True, exist_ok=True)
+        self._ensured_dir = download_dir
+
+def get_config() -> Config:
+    """Get the process-wide configuration, loading it on first call"""
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = Config()
+    return _instance
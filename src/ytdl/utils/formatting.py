@@ -0,0 +1,11 @@
+"""
+Display formatting helpers for YTDL application
+"""
+
+from functools import lru_cache
+
+@lru_cache(maxsize=4096)
+def format_mmss(seconds: int) -> str:
+    """Format whole seconds as MM:SS, minutes keep counting past an hour"""
+    minutes, secs = divmod(seconds, 60)
+    return f"{minutes:02d}:{secs:02d}"
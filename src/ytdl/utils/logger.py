@@ -2,46 +2,88 @@
 Logging configuration for YTDL application
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
-from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
+# Log file location, resolved once per process
+_LOG_FILE = os.path.join(os.path.expanduser('~'), '.ytdl', 'logs', 'ytdl.log')
+
+# Log file rotation size and number of old files kept
+LOG_MAX_BYTES = 10_000_000
+LOG_BACKUP_COUNT = 3
+
+# Write buffer for the log file, warnings and errors are flushed straight away
+LOG_BUFFER_SIZE = 65536
+
+# Record format shared by the console and file handlers
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Logger names setup_logger() has already configured
+_CONFIGURED = set()
+
+class _LogFileHandler(RotatingFileHandler):
+    """Buffered rotating file handler that creates its directory and file with the first record"""
+    
+    def __init__(self, filename: str):
+        super().__init__(filename, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, delay=True)
+        self._flush_now = True
+    
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record: logging.LogRecord):
+        self._flush_now = record.levelno >= logging.WARNING
+        super().emit(record)
+    
+    def flush(self):
+        # StreamHandler flushes after every record, only let that through for warnings and up,
+        # closing the file on exit or rollover still writes out the rest
+        if self._flush_now:
+            super().flush()
+
 def setup_logger(name: str = 'ytdl', level: int = logging.INFO) -> logging.Logger:
     """Setup and configure logger for the application"""
     
+    # Already set up, don't add duplicate handlers
+    if name in _CONFIGURED:
+        return logging.getLogger(name)
+    
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
-    # Avoid duplicate handlers
-    if logger.handlers:
-        return logger
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler (optional)
-    try:
-        log_dir = Path.home() / '.ytdl' / 'logs'
-        log_dir.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_dir / 'ytdl.log')
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    except Exception as e:
-        logger.warning(f"Could not setup file logging: {e}")
+    console_handler.setFormatter(_FORMATTER)
+    handlers = [console_handler]
+    
+    # File handler, nothing touches the disk until the first record is written
+    file_handler = _LogFileHandler(_LOG_FILE)
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(_FORMATTER)
+    handlers.append(file_handler)
+    
+    # Log calls only enqueue the record, a background thread formats and writes it,
+    # so progress callbacks on download threads never wait on console or file I/O
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Flush whatever is still queued on exit
+    atexit.register(listener.stop)
     
+    _CONFIGURED.add(name)
     return logger
 
 def get_logger(name: str = 'ytdl') -> logging.Logger: